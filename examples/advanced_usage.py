@@ -11,11 +11,20 @@ Run this example:
     python examples/advanced_usage.py
 """
 
-from collections import Counter
+import random
+from array import array
+from collections.abc import Mapping
+from functools import lru_cache
+from itertools import compress, repeat
+from operator import eq, itemgetter
+from types import MappingProxyType
 
 from condition_axis import (
+    AXIS_VALUE_INDEX,
+    AXIS_VALUES,
     condition_to_prompt,
-    generate_condition,
+    generate_condition_with_rng,
+    generate_conditions_range,
 )
 
 # Import internal data structures for inspection
@@ -23,9 +32,51 @@ from condition_axis.character_conditions import (
     AXIS_POLICY,
     CONDITION_AXES,
     EXCLUSIONS,
+    MANDATORY_SET,
+    OPTIONAL_SET,
     WEIGHTS,
 )
 
+# One generator reseeded per character; identical to generate_condition(seed=k)
+# without allocating a fresh Random for every seed.
+_RNG = random.Random()
+
+# Histogram bars are slices of one prebuilt string rather than a new "█" * n
+# per row; 128 covers every bar drawn here (percentages and freq / 10).
+_BAR = "█" * 128
+
+
+@lru_cache(maxsize=4096)
+def _cached_condition(seed: int) -> Mapping[str, str]:
+    """Return the character for a seed, reusing earlier results.
+
+    Seeded generation is deterministic, so examples that sweep overlapping
+    seed ranges can share results. The dict is wrapped read-only so no
+    caller can mutate the cached instance.
+
+    Args:
+        seed: Random seed for reproducible generation.
+
+    Returns:
+        Read-only mapping of axis names to values.
+    """
+    _RNG.seed(seed)
+    return MappingProxyType(generate_condition_with_rng(_RNG))
+
+
+@lru_cache(maxsize=1)
+def _shared_range() -> Mapping[str, array[int]]:
+    """Return seeds 0-999 as integer-coded columns, shared by examples 1, 4 and 5.
+
+    Row i is generate_condition(seed=i) encoded via AXIS_VALUES (-1 = axis
+    absent), so examples slice or filter columns instead of looping over
+    per-seed dicts. Callers only read the columns.
+
+    Returns:
+        Read-only mapping of axis names to int code columns.
+    """
+    return MappingProxyType(generate_conditions_range(0, 1000))
+
 
 def example_1_understanding_weights() -> None:
     """Demonstrate how weighted distributions affect generation.
@@ -41,25 +92,29 @@ def example_1_understanding_weights() -> None:
     # Show wealth axis weights
     print("\nWealth Axis Weights:")
     wealth_weights = WEIGHTS.get("wealth", {})
-    for value, weight in sorted(wealth_weights.items(), key=lambda x: -x[1]):
-        bar = "█" * int(weight * 10)
-        print(f"  {value:12} ({weight:3.1f}): {bar}")
+    lines = []
+    for value, weight in sorted(wealth_weights.items(), key=itemgetter(1), reverse=True):
+        bar = _BAR[: int(weight * 10)]
+        lines.append(f"  {value:12} ({weight:3.1f}): {bar}")
+    print("\n".join(lines))
 
     # Generate 1000 characters to demonstrate distribution
     print("\nGenerating 1000 characters to demonstrate distribution...")
-    wealth_counts: Counter[str] = Counter()
+    wealth_codes = _shared_range()["wealth"]
 
-    for seed in range(1000):
-        char = generate_condition(seed=seed)
-        if "wealth" in char:
-            wealth_counts[char["wealth"]] += 1
+    # Tally integer codes (k C-level scans), decoding only the k output rows
+    wealth_counts = [
+        (value, wealth_codes.count(code)) for code, value in enumerate(AXIS_VALUES["wealth"])
+    ]
 
     print("\nGenerated Wealth Distribution (out of 1000):")
-    total = sum(wealth_counts.values())
-    for value, count in sorted(wealth_counts.items(), key=lambda x: -x[1]):
+    total = sum(count for _, count in wealth_counts)
+    lines = []
+    for value, count in sorted(wealth_counts, key=itemgetter(1), reverse=True):
         percentage = (count / total) * 100
-        bar = "█" * int(percentage)
-        print(f"  {value:12} ({count:4}): {bar} {percentage:.1f}%")
+        bar = _BAR[: int(percentage)]
+        lines.append(f"  {value:12} ({count:4}): {bar} {percentage:.1f}%")
+    print("\n".join(lines))
 
     print("\nNotice how the distribution matches the weights!")
 
@@ -95,7 +150,7 @@ def example_2_exclusion_rules_in_action() -> None:
     decadent_chars = []
 
     for seed in range(200):
-        char = generate_condition(seed=seed)
+        char = _cached_condition(seed)
         if char.get("wealth") == "decadent":
             decadent_chars.append((seed, char))
             if len(decadent_chars) >= 3:
@@ -133,16 +188,25 @@ def example_3_mandatory_vs_optional_axes() -> None:
     print("\nGenerating 20 characters to show axis variety:")
     print("(M = Mandatory, O = Optional)\n")
 
+    # Mandatory axes are always drawn, but an exclusion rule can still drop one
+    # (e.g. decadent wealth removes frail physique), so M is not a constant.
+    # The policy partitions the axes, though, so M = total - O per character.
+    assert MANDATORY_SET.isdisjoint(OPTIONAL_SET)
+    assert MANDATORY_SET | OPTIONAL_SET == CONDITION_AXES.keys()
+
+    lines = []
     for seed in range(20):
-        char = generate_condition(seed=seed)
-        axes_present = set(char.keys())
+        char = _cached_condition(seed)
 
-        mandatory_count = len(axes_present & set(AXIS_POLICY["mandatory"]))
-        optional_count = len(axes_present & set(AXIS_POLICY["optional"]))
+        total_count = len(char)
+        optional_count = len(char.keys() & OPTIONAL_SET)
+        mandatory_count = total_count - optional_count
 
-        print(f"  Seed {seed:2}: {len(axes_present)} axes | ", end="")
-        print(f"M={mandatory_count} O={optional_count} | ", end="")
-        print(f"{', '.join(char.keys())}")
+        lines.append(
+            f"  Seed {seed:2}: {total_count} axes | "
+            f"M={mandatory_count} O={optional_count} | {', '.join(char)}"
+        )
+    print("\n".join(lines))
 
 
 def example_4_analyzing_generation_patterns() -> None:
@@ -162,38 +226,39 @@ def example_4_analyzing_generation_patterns() -> None:
     sample_size = 500
     print(f"\nGenerating {sample_size} characters for analysis...")
 
-    physique_counts: Counter[str] = Counter()
-    health_counts: Counter[str] = Counter()
-    age_counts: Counter[str] = Counter()
-    total_axes_count: Counter[int] = Counter()
+    # Seeds 0..sample_size-1 as integer-coded columns (-1 = axis absent)
+    columns = {axis: column[:sample_size] for axis, column in _shared_range().items()}
 
-    for seed in range(sample_size):
-        char = generate_condition(seed=seed)
+    physique_column = columns["physique"]
+    physique_counts = [
+        (value, physique_column.count(code)) for code, value in enumerate(AXIS_VALUES["physique"])
+    ]
 
-        if "physique" in char:
-            physique_counts[char["physique"]] += 1
-        total_axes_count[len(char)] += 1
+    # Number of axes present per character, then tallied the same way
+    axes_per_row = [len(row) - row.count(-1) for row in zip(*columns.values(), strict=True)]
+    total_axes_count = [(n, axes_per_row.count(n)) for n in range(len(CONDITION_AXES) + 1)]
 
-        if "health" in char:
-            health_counts[char["health"]] += 1
-        if "age" in char:
-            age_counts[char["age"]] += 1
+    health_present = sample_size - columns["health"].count(-1)
+    age_present = sample_size - columns["age"].count(-1)
 
     # Report statistics
-    print("\nPhysique Distribution:")
-    for value, count in physique_counts.most_common():
-        print(f"  {value:10} : {count:4} ({count/sample_size*100:5.1f}%)")
-
-    print("\nTotal Axes Count (Mandatory + Optional):")
-    for count, freq in sorted(total_axes_count.items()):
-        bar = "█" * int(freq / 10)
-        print(f"  {count} axes: {freq:4} {bar}")
-
-    print("\nOptional Axes Appearance Rate:")
-    print(
-        f"  Health: {len(health_counts):4} / {sample_size} ({len(health_counts)/sample_size*100:.1f}%)"
+    lines = ["\nPhysique Distribution:"]
+    for value, count in sorted(physique_counts, key=itemgetter(1), reverse=True):
+        lines.append(f"  {value:10} : {count:4} ({count/sample_size*100:5.1f}%)")
+
+    lines.append("\nTotal Axes Count (Mandatory + Optional):")
+    for count, freq in total_axes_count:
+        if not freq:
+            continue
+        bar = _BAR[: int(freq / 10)]
+        lines.append(f"  {count} axes: {freq:4} {bar}")
+
+    lines.append("\nOptional Axes Appearance Rate:")
+    lines.append(
+        f"  Health: {health_present:4} / {sample_size} ({health_present/sample_size*100:.1f}%)"
     )
-    print(f"  Age: {len(age_counts):4} / {sample_size} ({len(age_counts)/sample_size*100:.1f}%)")
+    lines.append(f"  Age: {age_present:4} / {sample_size} ({age_present/sample_size*100:.1f}%)")
+    print("\n".join(lines))
 
 
 def example_5_cross_system_exclusions() -> None:
@@ -212,16 +277,22 @@ def example_5_cross_system_exclusions() -> None:
     print("\nTesting exclusion: young age cannot be weathered")
     print("Generating 1000 characters...\n")
 
-    young_chars = []
-    for seed in range(1000):
-        char = generate_condition(seed=seed)
-        if char.get("age") == "young":
-            young_chars.append(char)
+    columns = _shared_range()
+
+    # Filter the facial_signal codes down to young rows at C level, then
+    # tally just those codes in one Python-level pass
+    young = AXIS_VALUE_INDEX["age"]["young"]
+    ages = columns["age"]
+    young_total = ages.count(young)
+    signal_counts = [0] * len(AXIS_VALUES["facial_signal"])
+    for code in compress(columns["facial_signal"], map(eq, ages, repeat(young))):
+        if code != -1:
+            signal_counts[code] += 1
 
-    print(f"Found {len(young_chars)} young characters")
+    print(f"Found {young_total} young characters")
 
     # Check if any have weathered facial signal (should be 0)
-    weathered_count = sum(1 for c in young_chars if c.get("facial_signal") == "weathered")
+    weathered_count = signal_counts[AXIS_VALUE_INDEX["facial_signal"]["weathered"]]
 
     print(f"Weathered young characters: {weathered_count} (should be 0)")
 
@@ -231,12 +302,11 @@ def example_5_cross_system_exclusions() -> None:
         print("✗ Exclusion rule violation detected!")
 
     # Show what facial signals young characters DO have
-    if young_chars:
-        facial_signals = [c.get("facial_signal") for c in young_chars if "facial_signal" in c]
-        if facial_signals:
-            signal_counts = Counter(facial_signals)
-            print("\nFacial signals found in young characters:")
-            for signal, count in signal_counts.most_common():
+    if any(signal_counts):
+        print("\nFacial signals found in young characters:")
+        by_signal = zip(AXIS_VALUES["facial_signal"], signal_counts, strict=True)
+        for signal, count in sorted(by_signal, key=itemgetter(1), reverse=True):
+            if count:
                 print(f"  {signal}: {count}")
 
 
@@ -258,15 +328,15 @@ def example_6_inspecting_raw_data() -> None:
         print(f"  {axis:10} : {', '.join(values)}")
 
     print("\nWeighted Axes:")
-    for axis in WEIGHTS.keys():
-        weight_count = len(WEIGHTS[axis])
+    for axis, weights in WEIGHTS.items():
+        weight_count = len(weights)
         print(f"  {axis:10} : {weight_count} weighted values")
 
     print("\nExclusion Rules Count:")
     print(f"  Total trigger conditions: {len(EXCLUSIONS)}")
 
     print("\nExample Exclusion:")
-    example_key = next(iter(EXCLUSIONS.keys()))
+    example_key = next(iter(EXCLUSIONS))
     example_exclusions = EXCLUSIONS[example_key]
     print(f"  When {example_key}:")
     for axis, blocked_values in example_exclusions.items():
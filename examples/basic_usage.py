@@ -141,16 +141,10 @@ def example_5_multiple_entities() -> None:
     print("EXAMPLE 5: Multiple Distinct Entities")
     print("=" * 70)
 
-    # Generate three different characters
-    characters = [
-        (1, generate_condition(seed=1)),
-        (2, generate_condition(seed=2)),
-        (3, generate_condition(seed=3)),
-    ]
-
+    # Generate three different characters (one seed each)
     print("\nThree Distinct Characters:")
-    for char_id, char_data in characters:
-        prompt = condition_to_prompt(char_data)
+    for char_id in (1, 2, 3):
+        prompt = condition_to_prompt(generate_condition(seed=char_id))
         print(f"  Character #{char_id}: {prompt}")
 
 
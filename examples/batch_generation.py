@@ -11,43 +11,108 @@ Run this example:
     python examples/batch_generation.py
 """
 
+import csv
 import json
-from collections.abc import Iterator
-from typing import Any
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from itertools import islice
+from multiprocessing import Pool
+from typing import Any, BinaryIO, TextIO
 
 from condition_axis import (
+    AXIS_VALUES,
+    CONDITION_AXES,
+    OCCUPATION_AXES,
     condition_to_prompt,
     generate_condition,
+    generate_conditions_range,
     generate_occupation_condition,
     occupation_condition_to_prompt,
 )
 
+# Column order for CSV export: seed, every character axis (facial_signal
+# included), every occupation axis, then the combined prompt
+CSV_FIELDNAMES: tuple[str, ...] = ("seed", *CONDITION_AXES, *OCCUPATION_AXES, "full_prompt")
 
-def generate_entity(seed: int) -> dict[str, Any]:
+# Wealth values the filtering and streaming examples count as "wealthy"
+WEALTHY: frozenset[str] = frozenset({"wealthy", "decadent"})
+
+# File buffer for exports (pass as open(..., buffering=EXPORT_BUFFERING)).
+# The streaming writers issue many small writes; a 1 MiB buffer flushes
+# them in far fewer write syscalls than the default 8 KiB one.
+EXPORT_BUFFERING: int = 1024 * 1024
+
+# Integer code of each occupation value (its index in OCCUPATION_AXES[axis]),
+# the occupation counterpart of AXIS_VALUE_INDEX
+_OCCUPATION_VALUE_INDEX: dict[str, dict[str, int]] = {
+    axis: {value: code for code, value in enumerate(values)}
+    for axis, values in OCCUPATION_AXES.items()
+}
+
+
+@dataclass(slots=True, frozen=True)
+class Entity:
+    """A complete entity: a seed and its three condition systems.
+
+    Slotted so batches of thousands stay compact and field access is an
+    attribute fetch rather than a dict lookup. The condition groups remain
+    the plain axis -> value dicts the generators return, since the axis set
+    is defined by data (CONDITION_AXES, OCCUPATION_AXES) rather than fields.
+
+    Attributes:
+        seed: Random seed the entity was generated from.
+        character: Character condition dict.
+        facial: Facial condition dict.
+        occupation: Occupation condition dict.
+    """
+
+    seed: int
+    character: dict[str, str]
+    facial: dict[str, str]
+    occupation: dict[str, str]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the entity to the nested dict layout used for JSON export.
+
+        Returns:
+            Dictionary with "seed", "character", "facial" and "occupation" keys.
+        """
+        return {
+            "seed": self.seed,
+            "character": self.character,
+            "facial": self.facial,
+            "occupation": self.occupation,
+        }
+
+
+def generate_entity(seed: int) -> Entity:
     """Generate a complete entity with all three condition systems.
 
     Args:
         seed: Random seed for reproducible generation.
 
     Returns:
-        Dictionary containing seed and all three condition types.
+        Entity holding the seed and all three condition types.
 
     Example:
         >>> entity = generate_entity(42)
-        >>> entity['seed']
+        >>> entity.seed
         42
-        >>> 'character' in entity
+        >>> 'wealth' in entity.character
         True
     """
-    return {
-        "seed": seed,
-        "character": generate_condition(seed=seed),
-        "facial": {"facial_signal": generate_condition(seed=seed).get("facial_signal", "")},
-        "occupation": generate_occupation_condition(seed=seed),
-    }
+    character = generate_condition(seed=seed)
+    return Entity(
+        seed=seed,
+        character=character,
+        facial={"facial_signal": character.get("facial_signal", "")},
+        occupation=generate_occupation_condition(seed=seed),
+    )
 
 
-def generate_batch(start_seed: int, count: int) -> list[dict[str, Any]]:
+def generate_batch(start_seed: int, count: int) -> list[Entity]:
     """Generate a batch of complete entities.
 
     Args:
@@ -55,19 +120,321 @@ def generate_batch(start_seed: int, count: int) -> list[dict[str, Any]]:
         count: Number of entities to generate.
 
     Returns:
-        List of entity dictionaries.
+        List of entities.
 
     Example:
         >>> batch = generate_batch(0, 10)
         >>> len(batch)
         10
-        >>> batch[0]['seed']
+        >>> batch[0].seed
         0
     """
     return [generate_entity(start_seed + i) for i in range(count)]
 
 
-def generate_streaming(start_seed: int, count: int) -> Iterator[dict[str, Any]]:
+def generate_batch_columnar(start_seed: int, count: int) -> dict[str, list[Any]]:
+    """Generate a batch of entities as columns (one list per field).
+
+    Same entities as generate_batch(), laid out struct-of-arrays: a "seed"
+    column, then one column per character axis (facial_signal included) and
+    per occupation axis. Filters and exports can work a column at a time
+    instead of walking nested dicts entity by entity.
+
+    Args:
+        start_seed: Starting seed value.
+        count: Number of entities to generate.
+
+    Returns:
+        Dictionary mapping field names to lists of length count. Absent
+        axes are None.
+
+    Example:
+        >>> columns = generate_batch_columnar(0, 10)
+        >>> columns["seed"][:3]
+        [0, 1, 2]
+        >>> columns["wealth"][0] == generate_entity(0).character["wealth"]
+        True
+    """
+    codes = generate_batch_codes(start_seed, count)
+    columns: dict[str, list[Any]] = {"seed": codes["seed"].tolist()}
+    for axis, values in (*AXIS_VALUES.items(), *OCCUPATION_AXES.items()):
+        columns[axis] = [values[code] if code >= 0 else None for code in codes[axis]]
+
+    return columns
+
+
+def generate_batch_codes(start_seed: int, count: int) -> dict[str, array[int]]:
+    """Generate a batch of entities as integer code columns.
+
+    The numeric form of generate_batch_columnar(): each axis value is stored
+    as its index in CONDITION_AXES[axis] or OCCUPATION_AXES[axis], with -1
+    for absent axes, in one compact int array per column. Counting and
+    filtering compare ints; decode to strings only when exporting.
+
+    Args:
+        start_seed: Starting seed value.
+        count: Number of entities to generate.
+
+    Returns:
+        Dictionary mapping "seed", every character axis and every occupation
+        axis to an ``array('q')`` / ``array('i')`` of length count.
+
+    Example:
+        >>> codes = generate_batch_codes(0, 10)
+        >>> code = codes["legitimacy"][0]
+        >>> OCCUPATION_AXES["legitimacy"][code] == generate_entity(0).occupation["legitimacy"]
+        True
+    """
+    stop = start_seed + count
+    columns: dict[str, array[int]] = {"seed": array("q", range(start_seed, stop))}
+    columns.update(generate_conditions_range(start_seed, stop))
+
+    occupation = {axis: array("i", [-1]) * len(columns["seed"]) for axis in OCCUPATION_AXES}
+    for row, seed in enumerate(columns["seed"]):
+        for axis, value in generate_occupation_condition(seed=seed).items():
+            occupation[axis][row] = _OCCUPATION_VALUE_INDEX[axis][value]
+    columns.update(occupation)
+
+    return columns
+
+
+def generate_batch_parallel(
+    start_seed: int, count: int, workers: int | None = None, chunk: int = 1000
+) -> Iterator[Entity]:
+    """Generate entities in worker processes over disjoint seed ranges.
+
+    The seeds are split into ranges of ``chunk`` entities, each generated by
+    one pool task. Entities are yielded as each range completes, so ranges
+    may arrive out of order (every entity carries its seed). A batch that
+    fits in one range is generated in-process, skipping pool startup.
+
+    Args:
+        start_seed: Starting seed value.
+        count: Number of entities to generate.
+        workers: Number of worker processes (default: os.cpu_count()).
+        chunk: Number of entities per task.
+
+    Returns:
+        Iterator over the entities, grouped by seed range.
+
+    Raises:
+        ValueError: If chunk or workers is less than 1. Checked on the call,
+            not on the first next().
+
+    Example:
+        >>> entities = generate_batch_parallel(0, 100, workers=2, chunk=50)
+        >>> sorted(e.seed for e in entities) == list(range(100))
+        True
+    """
+    if chunk < 1:
+        raise ValueError(f"chunk must be at least 1, got {chunk}")
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+
+    tasks = [
+        (seed, min(chunk, start_seed + count - seed))
+        for seed in range(start_seed, start_seed + count, chunk)
+    ]
+    if len(tasks) <= 1 or workers == 1:
+        return generate_streaming(start_seed, count)
+    return _run_tasks(tasks, workers)
+
+
+def _run_tasks(tasks: list[tuple[int, int]], workers: int | None) -> Iterator[Entity]:
+    """Run seed-range tasks in a process pool, yielding entities as they finish.
+
+    Args:
+        tasks: (start_seed, count) pairs from generate_batch_parallel().
+        workers: Number of worker processes (default: os.cpu_count()).
+
+    Yields:
+        Entities, grouped by seed range.
+    """
+    with Pool(processes=workers) as pool:
+        for entities in pool.imap_unordered(_generate_task, tasks):
+            yield from entities
+
+
+def _generate_task(task: tuple[int, int]) -> list[Entity]:
+    """Generate one seed range in a worker process.
+
+    Args:
+        task: (start_seed, count) pair.
+
+    Returns:
+        List of entities for the range.
+    """
+    start_seed, count = task
+    return generate_batch(start_seed, count)
+
+
+def write_entities_json(fp: TextIO, start_seed: int, count: int, metadata: dict[str, Any]) -> None:
+    """Stream a batch to a file as one JSON document.
+
+    Writes ``{"metadata": ..., "entities": [...]}`` one entity at a time via
+    generate_streaming(), so memory use stays at a single entity no matter
+    how large the batch is. The output parses to the same document as
+    ``json.dumps({"metadata": metadata, "entities": [...]})`` over the
+    to_dict() of each entity in generate_batch().
+
+    Args:
+        fp: Writable text file object; open files with
+            buffering=EXPORT_BUFFERING for large batches.
+        start_seed: Starting seed value.
+        count: Number of entities to write.
+        metadata: JSON-serializable metadata stored alongside the entities.
+
+    Example:
+        >>> import io
+        >>> buffer = io.StringIO()
+        >>> write_entities_json(buffer, 0, 2, {"count": 2})
+        >>> len(json.loads(buffer.getvalue())["entities"])
+        2
+    """
+    # json.dumps() encodes each entity in one C call; json.dump() would walk
+    # the pure-Python iterencode path and issue a write per token
+    write = fp.write
+    write(f'{{"metadata": {json.dumps(metadata)}, "entities": [')
+    for i, entity in enumerate(generate_streaming(start_seed, count)):
+        if i:
+            write(", ")
+        write(json.dumps(entity.to_dict()))
+    write("]}")
+
+
+def write_entities_csv(fp: TextIO, start_seed: int, count: int) -> None:
+    """Stream a batch to a file as CSV, one row per entity.
+
+    Rows go straight from generate_streaming() into csv.writer in
+    CSV_FIELDNAMES order; no list of rows is built. A single writerows()
+    call drives the whole iterator, so the per-row loop runs in the C csv
+    module rather than as a Python-level writerow() call per entity.
+
+    Args:
+        fp: Writable text file object, opened with newline="" (and
+            buffering=EXPORT_BUFFERING for large batches).
+        start_seed: Starting seed value.
+        count: Number of entities to write.
+
+    Example:
+        >>> import io
+        >>> buffer = io.StringIO()
+        >>> write_entities_csv(buffer, 0, 2)
+        >>> len(buffer.getvalue().splitlines())
+        3
+    """
+    writer = csv.writer(fp)
+    writer.writerow(CSV_FIELDNAMES)
+    writer.writerows(map(_csv_row, generate_streaming(start_seed, count)))
+
+
+def write_entities_codes(fp: BinaryIO, start_seed: int, count: int) -> None:
+    """Write a batch as dictionary-encoded binary columns.
+
+    A compact columnar alternative to JSON/CSV: one JSON header line (row
+    count, byte order, and per column its array typecode and value
+    vocabulary), followed by each column of generate_batch_codes() as raw
+    array bytes. Axis values cost 4 bytes per row instead of a repeated
+    string, and read_entities_codes() loads each column with one
+    array.fromfile() call.
+
+    Args:
+        fp: Writable binary file object (see EXPORT_BUFFERING).
+        start_seed: Starting seed value.
+        count: Number of entities to write.
+
+    Example:
+        >>> import io
+        >>> buffer = io.BytesIO()
+        >>> write_entities_codes(buffer, 0, 10)
+        >>> _ = buffer.seek(0)
+        >>> read_entities_codes(buffer)["seed"].tolist() == list(range(10))
+        True
+    """
+    codes = generate_batch_codes(start_seed, count)
+    vocabularies = {**AXIS_VALUES, **OCCUPATION_AXES}
+    header = {
+        "count": len(codes["seed"]),
+        "byteorder": sys.byteorder,
+        "columns": [
+            {
+                "name": name,
+                "typecode": column.typecode,
+                "values": list(vocabularies[name]) if name in vocabularies else None,
+            }
+            for name, column in codes.items()
+        ],
+    }
+    fp.write(json.dumps(header).encode("utf-8") + b"\n")
+    for column in codes.values():
+        column.tofile(fp)
+
+
+def read_entities_codes(fp: BinaryIO) -> dict[str, array[int]]:
+    """Read a batch written by write_entities_codes().
+
+    Args:
+        fp: Readable binary file object positioned at the header line.
+
+    Returns:
+        The integer code columns, as returned by generate_batch_codes().
+        Decode a code with the column's vocabulary (AXIS_VALUES or
+        OCCUPATION_AXES); -1 means the axis is absent.
+    """
+    header = json.loads(fp.readline())
+    columns: dict[str, array[int]] = {}
+    for spec in header["columns"]:
+        column = array(spec["typecode"])
+        column.fromfile(fp, header["count"])
+        if header["byteorder"] != sys.byteorder:
+            column.byteswap()
+        columns[spec["name"]] = column
+    return columns
+
+
+def _csv_row(entity: Entity) -> tuple[Any, ...]:
+    """Flatten an entity into a tuple in CSV_FIELDNAMES order.
+
+    Args:
+        entity: Entity from generate_entity().
+
+    Returns:
+        Seed, character axis values, occupation axis values and the combined
+        prompt, with "" for absent axes.
+    """
+    char = entity.character
+    occ = entity.occupation
+    return (
+        entity.seed,
+        *[char.get(axis, "") for axis in CONDITION_AXES],
+        *[occ.get(axis, "") for axis in OCCUPATION_AXES],
+        _entity_prompt(entity),
+    )
+
+
+def _entity_prompt(entity: Entity) -> str:
+    """Combine an entity's character, facial and occupation prompts.
+
+    Args:
+        entity: Entity from generate_entity().
+
+    Returns:
+        Comma-separated prompt covering all three condition systems, with
+        empty parts (e.g. no facial signal) skipped.
+    """
+    return ", ".join(
+        filter(
+            None,
+            (
+                condition_to_prompt(entity.character),
+                condition_to_prompt(entity.facial),
+                occupation_condition_to_prompt(entity.occupation),
+            ),
+        )
+    )
+
+
+def generate_streaming(start_seed: int, count: int) -> Iterator[Entity]:
     """Generate entities one at a time for memory efficiency.
 
     This generator yields entities one at a time rather than creating
@@ -79,11 +446,11 @@ def generate_streaming(start_seed: int, count: int) -> Iterator[dict[str, Any]]:
         count: Number of entities to generate.
 
     Yields:
-        Entity dictionaries one at a time.
+        Entities one at a time.
 
     Example:
         >>> for entity in generate_streaming(0, 5):
-        ...     print(entity['seed'])
+        ...     print(entity.seed)
         0
         1
         2
@@ -94,6 +461,44 @@ def generate_streaming(start_seed: int, count: int) -> Iterator[dict[str, Any]]:
         yield generate_entity(start_seed + i)
 
 
+def generate_streaming_values(
+    start_seed: int, count: int, axes: Sequence[str]
+) -> Iterator[tuple[str | None, ...]]:
+    """Stream only selected axis values, one tuple per entity.
+
+    A slim generate_streaming() for loops that read a few axes: no Entity
+    or facial dict is built per seed, and a condition system none of the
+    axes belong to is not generated at all. Values match the corresponding
+    generate_entity() fields.
+
+    Args:
+        start_seed: Starting seed value.
+        count: Number of entities to generate.
+        axes: Character and/or occupation axis names, in output order.
+
+    Yields:
+        Tuple of each requested axis value (None if absent) per entity.
+
+    Example:
+        >>> for wealth, legitimacy in generate_streaming_values(0, 2, ("wealth", "legitimacy")):
+        ...     print(wealth, legitimacy)
+        poor tolerated
+        decadent sanctioned
+    """
+    # Index 0 reads the character condition, 1 the occupation condition
+    plan = [(1 if axis in OCCUPATION_AXES else 0, axis) for axis in axes]
+    need_character = any(source == 0 for source, _ in plan)
+    need_occupation = any(source == 1 for source, _ in plan)
+    empty: dict[str, str] = {}
+
+    for seed in range(start_seed, start_seed + count):
+        conditions = (
+            generate_condition(seed=seed) if need_character else empty,
+            generate_occupation_condition(seed=seed) if need_occupation else empty,
+        )
+        yield tuple([conditions[source].get(axis) for source, axis in plan])
+
+
 def example_1_simple_batch_generation() -> None:
     """Demonstrate generating a simple batch of entities.
 
@@ -113,13 +518,7 @@ def example_1_simple_batch_generation() -> None:
     print("First 5 entities:")
 
     for entity in batch[:5]:
-        seed = entity["seed"]
-        char_prompt = condition_to_prompt(entity["character"])
-        face_prompt = condition_to_prompt(entity["facial"])
-        occ_prompt = occupation_condition_to_prompt(entity["occupation"])
-
-        full_prompt = f"{char_prompt}, {face_prompt}, {occ_prompt}"
-        print(f"  Entity #{seed}: {full_prompt}")
+        print(f"  Entity #{entity.seed}: {_entity_prompt(entity)}")
 
 
 def example_2_export_to_json() -> None:
@@ -135,28 +534,26 @@ def example_2_export_to_json() -> None:
     print("EXAMPLE 2: Export to JSON")
     print("=" * 70)
 
-    batch = generate_batch(start_seed=100, count=5)
-
-    # Prepare for JSON serialization
-    json_data = {
-        "metadata": {
-            "generator": "pipeworks-conditional-axis",
-            "version": "0.10.0",
-            "start_seed": 100,
-            "count": 5,
-        },
-        "entities": batch,
+    start_seed, count = 100, 5
+    metadata = {
+        "generator": "pipeworks-conditional-axis",
+        "version": "0.10.0",
+        "start_seed": start_seed,
+        "count": count,
     }
 
-    # Convert to JSON string
-    json_output = json.dumps(json_data, indent=2)
-
-    print("\nJSON Output (first 500 characters):")
-    print(json_output[:500] + "...")
+    # Preview: encode only the entities shown, compactly, one per line
+    print("\nJSON Preview (metadata + first 3 entities):")
+    print(json.dumps(metadata))
+    for entity in generate_streaming(start_seed, min(count, 3)):
+        print(json.dumps(entity.to_dict()))
+    print("...")
 
-    # Optionally save to file
+    # Full export streams one entity at a time instead of building the whole
+    # document in memory:
     # output_path = Path("entities.json")
-    # output_path.write_text(json_output)
+    # with output_path.open("w", encoding="utf-8", buffering=EXPORT_BUFFERING) as f:
+    #     write_entities_json(f, start_seed, count, metadata)
     # print(f"\nSaved to: {output_path}")
 
 
@@ -173,59 +570,37 @@ def example_3_export_to_csv() -> None:
     print("EXAMPLE 3: Export to CSV")
     print("=" * 70)
 
-    batch = generate_batch(start_seed=200, count=10)
-
-    # Flatten entities for CSV (one row per entity)
-    csv_rows = []
-    for entity in batch:
-        char = entity["character"]
-        facial = entity["facial"]
-        occ = entity["occupation"]
-
-        row = {
-            "seed": entity["seed"],
-            # Character axes
-            "physique": char.get("physique", ""),
-            "wealth": char.get("wealth", ""),
-            "health": char.get("health", ""),
-            "demeanor": char.get("demeanor", ""),
-            "age": char.get("age", ""),
-            # Facial axes
-            "overall_impression": facial.get("overall_impression", ""),
-            # Occupation axes
-            "legitimacy": occ.get("legitimacy", ""),
-            "visibility": occ.get("visibility", ""),
-            "moral_load": occ.get("moral_load", ""),
-            "dependency": occ.get("dependency", ""),
-            "risk_exposure": occ.get("risk_exposure", ""),
-            # Combined prompt
-            "full_prompt": (
-                f"{condition_to_prompt(char)}, "
-                f"{condition_to_prompt(facial)}, "
-                f"{occupation_condition_to_prompt(occ)}"
-            ),
-        }
-        csv_rows.append(row)
+    start_seed, count = 200, 10
+
+    # Rows are flat tuples in CSV_FIELDNAMES order, built one entity at a time
+    rows = (_csv_row(entity) for entity in generate_streaming(start_seed, count))
 
     # Display as table
+    preview_index = [
+        CSV_FIELDNAMES.index(field)
+        for field in ("seed", "physique", "wealth", "legitimacy", "visibility")
+    ]
+
     print("\nCSV Preview (first 3 rows):\n")
     print(f"{'seed':<6} {'physique':<10} {'wealth':<12} {'legitimacy':<12} {'visibility':<12}")
     print("-" * 70)
 
-    for row in csv_rows[:3]:
-        print(
-            f"{row['seed']:<6} {row['physique']:<10} {row['wealth']:<12} "
-            f"{row['legitimacy']:<12} {row['visibility']:<12}"
-        )
+    for row in islice(rows, 3):
+        seed, physique, wealth, legitimacy, visibility = (row[k] for k in preview_index)
+        print(f"{seed:<6} {physique:<10} {wealth:<12} {legitimacy:<12} {visibility:<12}")
 
-    # Optionally save to file
+    # Full export streams rows straight into csv.writer, no row list:
     # output_path = Path("entities.csv")
-    # with output_path.open("w", newline="") as csvfile:
-    #     fieldnames = csv_rows[0].keys()
-    #     writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-    #     writer.writeheader()
-    #     writer.writerows(csv_rows)
+    # with output_path.open(
+    #     "w", newline="", encoding="utf-8", buffering=EXPORT_BUFFERING
+    # ) as csvfile:
+    #     write_entities_csv(csvfile, start_seed, count)
     # print(f"\nSaved to: {output_path}")
+    #
+    # For large batches, dictionary-encoded binary columns are far smaller
+    # and load a column at a time:
+    # with Path("entities.bin").open("wb", buffering=EXPORT_BUFFERING) as binfile:
+    #     write_entities_codes(binfile, start_seed, count)
 
 
 def example_4_filtering_and_selection() -> None:
@@ -242,57 +617,32 @@ def example_4_filtering_and_selection() -> None:
     batch_size = 100
     print(f"\nGenerating {batch_size} entities for filtering...")
 
-    batch = generate_batch(start_seed=0, count=batch_size)
-
-    # Filter 1: Find wealthy individuals
-    wealthy = [e for e in batch if e["character"].get("wealth") in ["wealthy", "decadent"]]
-
-    print("\nFilter 1: Wealthy individuals")
-    print(f"  Found: {len(wealthy)} / {batch_size} ({len(wealthy)/batch_size*100:.1f}%)")
-    if wealthy:
-        example = wealthy[0]
-        prompt = (
-            f"{condition_to_prompt(example['character'])}, "
-            f"{condition_to_prompt(example['facial'])}, "
-            f"{occupation_condition_to_prompt(example['occupation'])}"
-        )
-        print(f"  Example (seed {example['seed']}): {prompt}")
-
-    # Filter 2: Find illicit occupations
-    illicit = [e for e in batch if e["occupation"].get("legitimacy") == "illicit"]
-
-    print("\nFilter 2: Illicit occupations")
-    print(f"  Found: {len(illicit)} / {batch_size} ({len(illicit)/batch_size*100:.1f}%)")
-    if illicit:
-        example = illicit[0]
-        prompt = (
-            f"{condition_to_prompt(example['character'])}, "
-            f"{condition_to_prompt(example['facial'])}, "
-            f"{occupation_condition_to_prompt(example['occupation'])}"
-        )
-        print(f"  Example (seed {example['seed']}): {prompt}")
-
-    # Filter 3: Complex criteria - young and weathered
-    young_weathered = [
-        e
-        for e in batch
-        if e["character"].get("age") == "young"
-        and e["facial"].get("overall_impression") == "weathered"
+    columns = generate_batch_columnar(start_seed=0, count=batch_size)
+    seeds = columns["seed"]
+
+    # Each filter maps axes to the values it accepts. Masks are C-level set
+    # lookups over each column, ANDed per row for multi-axis filters.
+    # Counting and finding the first hit are C-level list scans (count /
+    # index), so no list of matching entities is built; only the first hit
+    # is rebuilt.
+    filters: list[tuple[str, dict[str, frozenset[str]]]] = [
+        ("Filter 1: Wealthy individuals", {"wealth": WEALTHY}),
+        ("Filter 2: Illicit occupations", {"legitimacy": frozenset({"illicit"})}),
+        (
+            "Filter 3: Young but weathered (complex criteria)",
+            {"age": frozenset({"young"}), "facial_signal": frozenset({"weathered"})},
+        ),
     ]
 
-    print("\nFilter 3: Young but weathered (complex criteria)")
-    print(
-        f"  Found: {len(young_weathered)} / {batch_size} "
-        f"({len(young_weathered)/batch_size*100:.1f}%)"
-    )
-    if young_weathered:
-        example = young_weathered[0]
-        prompt = (
-            f"{condition_to_prompt(example['character'])}, "
-            f"{condition_to_prompt(example['facial'])}, "
-            f"{occupation_condition_to_prompt(example['occupation'])}"
-        )
-        print(f"  Example (seed {example['seed']}): {prompt}")
+    for title, criteria in filters:
+        hits = [map(allowed.__contains__, columns[axis]) for axis, allowed in criteria.items()]
+        mask = list(map(all, zip(*hits, strict=True)))
+        found = mask.count(True)
+        print(f"\n{title}")
+        print(f"  Found: {found} / {batch_size} ({found/batch_size*100:.1f}%)")
+        if found:
+            seed = seeds[mask.index(True)]
+            print(f"  Example (seed {seed}): {_entity_prompt(generate_entity(seed))}")
 
 
 def example_5_memory_efficient_streaming() -> None:
@@ -313,12 +663,15 @@ def example_5_memory_efficient_streaming() -> None:
     illicit_count = 0
     young_count = 0
 
-    for entity in generate_streaming(start_seed=0, count=large_batch_size):
-        if entity["character"].get("wealth") in ["wealthy", "decadent"]:
+    # Only the three axes counted are pulled out of each entity
+    for wealth, legitimacy, age in generate_streaming_values(
+        start_seed=0, count=large_batch_size, axes=("wealth", "legitimacy", "age")
+    ):
+        if wealth in WEALTHY:
             wealthy_count += 1
-        if entity["occupation"].get("legitimacy") == "illicit":
+        if legitimacy == "illicit":
             illicit_count += 1
-        if entity["character"].get("age") == "young":
+        if age == "young":
             young_count += 1
 
     print(f"\nStatistics from {large_batch_size} entities:")
@@ -330,11 +683,11 @@ def example_5_memory_efficient_streaming() -> None:
 
 
 def example_6_parallel_generation_pattern() -> None:
-    """Demonstrate pattern for parallel generation (conceptual).
+    """Demonstrate parallel generation across worker processes.
 
-    For extremely large batches, you might want to use parallel
-    processing. This example shows the pattern (without actual
-    multiprocessing for simplicity).
+    Every seed is independent, so disjoint seed ranges can be generated in
+    separate processes. generate_batch_parallel() hands one range per task
+    to a multiprocessing pool and streams entities back as ranges finish.
     """
     print("\n" + "=" * 70)
     print("EXAMPLE 6: Parallel Generation Pattern")
@@ -344,47 +697,26 @@ def example_6_parallel_generation_pattern() -> None:
     num_workers = 4
     entities_per_worker = total_entities // num_workers
 
-    print(f"\nConcept: Generate {total_entities} entities using {num_workers} workers")
-    print(f"Each worker generates {entities_per_worker} entities\n")
+    print(f"\nGenerating {total_entities} entities using {num_workers} workers")
+    print(f"Each task generates {entities_per_worker} entities\n")
 
-    # Simulate worker assignments
-    workers = []
-    for worker_id in range(num_workers):
-        start_seed = worker_id * entities_per_worker
+    print("Task assignments (disjoint seed ranges):")
+    for task_id, start_seed in enumerate(range(0, total_entities, entities_per_worker)):
         end_seed = start_seed + entities_per_worker - 1
-        workers.append(
-            {
-                "worker_id": worker_id,
-                "start_seed": start_seed,
-                "end_seed": end_seed,
-                "count": entities_per_worker,
-            }
-        )
-
-    print("Worker assignments:")
-    for worker in workers:
-        print(
-            f"  Worker {worker['worker_id']}: "
-            f"seeds {worker['start_seed']}-{worker['end_seed']} "
-            f"({worker['count']} entities)"
-        )
-
-    print("\nImplementation pattern:")
-    print(
-        """
-    # Using Python's multiprocessing:
-    from multiprocessing import Pool
+        print(f"  Task {task_id}: seeds {start_seed}-{end_seed} ({entities_per_worker} entities)")
 
-    def worker_task(args):
-        start_seed, count = args
-        return generate_batch(start_seed, count)
+    # Ranges complete in any order, so count as entities arrive
+    seeds_seen = set()
+    wealthy_count = 0
+    for entity in generate_batch_parallel(
+        0, total_entities, workers=num_workers, chunk=entities_per_worker
+    ):
+        seeds_seen.add(entity.seed)
+        if entity.character.get("wealth") in WEALTHY:
+            wealthy_count += 1
 
-    with Pool(processes=4) as pool:
-        tasks = [(w['start_seed'], w['count']) for w in workers]
-        results = pool.map(worker_task, tasks)
-        all_entities = [e for batch in results for e in batch]
-    """
-    )
+    print(f"\nReceived {len(seeds_seen)} unique entities")
+    print(f"  Wealthy: {wealthy_count} ({wealthy_count/total_entities*100:.1f}%)")
 
 
 def main() -> None:
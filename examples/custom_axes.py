@@ -16,11 +16,62 @@ Run this example:
     python examples/custom_axes.py
 """
 
+import math
 import random
+from itertools import permutations
 from typing import Any
 
 # Import shared utilities from the base module
-from condition_axis._base import apply_exclusion_rules, values_to_prompt, weighted_choice
+from condition_axis._base import (
+    alias_choice,
+    apply_compiled_exclusions,
+    build_alias_table,
+    compile_exclusion_rules,
+    values_to_prompt,
+)
+
+# ============================================================================
+# Shared helper
+# ============================================================================
+
+
+def _build_optional_subsets(optional: list[str], max_optional: int) -> list[tuple[str, ...]]:
+    """Expand the optional-axis selection into a table for a single draw.
+
+    Generators pick optional axes with ``randint(0, max_optional)`` followed by
+    ``sample(optional, k)``: every count is equally likely, then every ordered
+    selection of that size. This lists each ordered selection as many times as
+    needed for a uniform pick from the table (``rng.choice(table)``) to have
+    exactly that distribution, replacing two RNG calls and a temporary list
+    per entity with one index.
+
+    The table has (k+1) * lcm(perm(n, 0..k)) entries, which is tiny for the
+    two-axis policies in this example but grows combinatorially, so it is
+    only meant for small optional pools.
+
+    Args:
+        optional: Optional axis names, in policy order.
+        max_optional: Maximum number of optional axes per entity (capped at
+                     ``len(optional)``).
+
+    Returns:
+        List of axis-name tuples to draw uniformly from.
+
+    Example:
+        >>> _build_optional_subsets(["a", "b"], 1)
+        [(), (), ('a',), ('b',)]
+    """
+    max_optional = min(max_optional, len(optional))
+    # Copies per selection of size k are lcm / perm(n, k), so each size
+    # carries the same total weight
+    lcm = math.lcm(*(math.perm(len(optional), k) for k in range(max_optional + 1)))
+    return [
+        selection
+        for k in range(max_optional + 1)
+        for selection in permutations(optional, k)
+        for _ in range(lcm // math.perm(len(optional), k))
+    ]
+
 
 # ============================================================================
 # CUSTOM SYSTEM 1: Fantasy Magic Axes
@@ -76,12 +127,32 @@ MAGIC_EXCLUSIONS: dict[tuple[str, str], dict[str, list[str]]] = {
     },
 }
 
+# Alias tables built once at import, so each draw is O(1) instead of
+# re-processing the weights on every call (unweighted axes get uniform tables)
+_MAGIC_TABLES: dict[str, tuple[list[float], list[int]]] = {
+    axis: build_alias_table(values, MAGIC_WEIGHTS.get(axis)) for axis, values in MAGIC_AXES.items()
+}
+
+# Exclusions indexed by trigger with frozenset blocked values, so only rules
+# the chosen values trigger are visited and each check is a set lookup
+_MAGIC_EXCLUSION_INDEX = compile_exclusion_rules(MAGIC_EXCLUSIONS)
+
+# Every ordered choice of optional axes, weighted by repetition so one
+# uniform pick matches randint(0, max_optional) followed by sample()
+_MAGIC_OPTIONAL_SUBSETS = _build_optional_subsets(
+    MAGIC_POLICY["optional"], MAGIC_POLICY["max_optional"]
+)
+
 
-def generate_magic_condition(seed: int | None = None) -> dict[str, str]:
+def generate_magic_condition(
+    seed: int | None = None, rng: random.Random | None = None
+) -> dict[str, str]:
     """Generate magic-related conditions using the axis pattern.
 
     Args:
         seed: Optional random seed for reproducible generation.
+        rng: Optional Random instance to draw from instead (seed is then
+            ignored). Never touches the global random module state.
 
     Returns:
         Dictionary mapping axis names to selected values.
@@ -93,31 +164,23 @@ def generate_magic_condition(seed: int | None = None) -> dict[str, str]:
         >>> 'proficiency' in magic
         True
     """
-    if seed is not None:
-        random.seed(seed)
+    if rng is None:
+        rng = random.Random(seed)
 
     result: dict[str, str] = {}
 
     # Select mandatory axes
     for axis in MAGIC_POLICY["mandatory"]:
-        options = MAGIC_AXES[axis]
-        weights = MAGIC_WEIGHTS.get(axis, None)
-        result[axis] = weighted_choice(options, weights)
+        prob, alias = _MAGIC_TABLES[axis]
+        result[axis] = alias_choice(MAGIC_AXES[axis], prob, alias, rng=rng)
 
-    # Select optional axes
-    optional_axes = MAGIC_POLICY["optional"]
-    max_optional = MAGIC_POLICY["max_optional"]
-
-    num_optional = random.randint(0, min(max_optional, len(optional_axes)))
-    selected_optional = random.sample(optional_axes, num_optional)
-
-    for axis in selected_optional:
-        options = MAGIC_AXES[axis]
-        weights = MAGIC_WEIGHTS.get(axis, None)
-        result[axis] = weighted_choice(options, weights)
+    # Select optional axes (one uniform pick from the precomputed selections)
+    for axis in rng.choice(_MAGIC_OPTIONAL_SUBSETS):
+        prob, alias = _MAGIC_TABLES[axis]
+        result[axis] = alias_choice(MAGIC_AXES[axis], prob, alias, rng=rng)
 
     # Apply exclusion rules
-    result = apply_exclusion_rules(result, MAGIC_EXCLUSIONS)
+    result = apply_compiled_exclusions(result, _MAGIC_EXCLUSION_INDEX)
 
     return result
 
@@ -190,12 +253,26 @@ TECH_EXCLUSIONS: dict[tuple[str, str], dict[str, list[str]]] = {
     },
 }
 
+# Tech alias tables, exclusion index and optional selections, precomputed
+# like the magic ones
+_TECH_TABLES: dict[str, tuple[list[float], list[int]]] = {
+    axis: build_alias_table(values, TECH_WEIGHTS.get(axis)) for axis, values in TECH_AXES.items()
+}
+_TECH_EXCLUSION_INDEX = compile_exclusion_rules(TECH_EXCLUSIONS)
+_TECH_OPTIONAL_SUBSETS = _build_optional_subsets(
+    TECH_POLICY["optional"], TECH_POLICY["max_optional"]
+)
+
 
-def generate_tech_condition(seed: int | None = None) -> dict[str, str]:
+def generate_tech_condition(
+    seed: int | None = None, rng: random.Random | None = None
+) -> dict[str, str]:
     """Generate technology-related conditions using the axis pattern.
 
     Args:
         seed: Optional random seed for reproducible generation.
+        rng: Optional Random instance to draw from instead (seed is then
+            ignored). Never touches the global random module state.
 
     Returns:
         Dictionary mapping axis names to selected values.
@@ -207,31 +284,23 @@ def generate_tech_condition(seed: int | None = None) -> dict[str, str]:
         >>> 'tech_access' in tech
         True
     """
-    if seed is not None:
-        random.seed(seed)
+    if rng is None:
+        rng = random.Random(seed)
 
     result: dict[str, str] = {}
 
     # Select mandatory axes
     for axis in TECH_POLICY["mandatory"]:
-        options = TECH_AXES[axis]
-        weights = TECH_WEIGHTS.get(axis, None)
-        result[axis] = weighted_choice(options, weights)
-
-    # Select optional axes
-    optional_axes = TECH_POLICY["optional"]
-    max_optional = TECH_POLICY["max_optional"]
-
-    num_optional = random.randint(0, min(max_optional, len(optional_axes)))
-    selected_optional = random.sample(optional_axes, num_optional)
+        prob, alias = _TECH_TABLES[axis]
+        result[axis] = alias_choice(TECH_AXES[axis], prob, alias, rng=rng)
 
-    for axis in selected_optional:
-        options = TECH_AXES[axis]
-        weights = TECH_WEIGHTS.get(axis, None)
-        result[axis] = weighted_choice(options, weights)
+    # Select optional axes (one uniform pick from the precomputed selections)
+    for axis in rng.choice(_TECH_OPTIONAL_SUBSETS):
+        prob, alias = _TECH_TABLES[axis]
+        result[axis] = alias_choice(TECH_AXES[axis], prob, alias, rng=rng)
 
     # Apply exclusion rules
-    result = apply_exclusion_rules(result, TECH_EXCLUSIONS)
+    result = apply_compiled_exclusions(result, _TECH_EXCLUSION_INDEX)
 
     return result
 
@@ -399,17 +468,22 @@ def example_5_custom_axis_pattern_summary() -> None:
    - Example: {("proficiency", "latent"): {"manifestation": ["catastrophic"]}}
 
 5. Write generate_<name>_condition() Function
-   - Use weighted_choice() for value selection
-   - Use apply_exclusion_rules() for coherence
-   - Accept optional seed parameter
+   - Build one alias table per axis at import (build_alias_table) and
+     draw with alias_choice(); weighted_choice() also works for one-offs
+   - Use apply_exclusion_rules() for coherence, or compile the rules once
+     (compile_exclusion_rules) and use apply_compiled_exclusions()
+   - Accept optional seed (or rng) parameter; draw from a local
+     random.Random, never the global random module
 
 6. Write <name>_condition_to_prompt() Function
    - Use values_to_prompt() for serialization
    - Returns comma-separated string
 
 7. Use Shared Utilities from _base.py
-   - weighted_choice(options, weights)
+   - build_alias_table(options, weights) / alias_choice(options, prob, alias, rng)
+   - weighted_choice(options, weights, rng=rng)
    - apply_exclusion_rules(result, exclusions)
+   - compile_exclusion_rules(exclusions) / apply_compiled_exclusions(result, index)
    - values_to_prompt(condition_dict)
 
 ╔══════════════════════════════════════════════════════════════════╗
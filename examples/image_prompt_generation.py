@@ -10,8 +10,13 @@ This example demonstrates integration with AI image generation tools:
 
 Run this example:
     python examples/image_prompt_generation.py
+
+Pass --no-tips to skip the static best-practices text (example 7).
 """
 
+import argparse
+from collections.abc import Sequence
+from dataclasses import dataclass
 
 from condition_axis import (
     condition_to_prompt,
@@ -20,13 +25,126 @@ from condition_axis import (
     occupation_condition_to_prompt,
 )
 
+# Common quality issues every negative prompt avoids, joined once at import
+_BASE_NEGATIVES: tuple[str, ...] = (
+    "low quality",
+    "blurry",
+    "distorted",
+    "deformed",
+    "duplicate",
+    "watermark",
+)
+_BASE_NEGATIVES_PROMPT = ", ".join(_BASE_NEGATIVES)
+
+# Static example presets, built once at import rather than on every call
+_STYLES: tuple[str, ...] = (
+    "portrait photograph",
+    "oil painting",
+    "pencil sketch",
+    "3d render, octane",
+    "watercolor illustration",
+    "digital art, concept art",
+)
+
+# Quality tag sets for different needs, stored pre-joined
+_QUALITY_PRESETS: dict[str, str] = {
+    "Photorealistic": ", ".join(
+        ("highly detailed", "8k resolution", "photorealistic", "professional photography")
+    ),
+    "Artistic": ", ".join(
+        ("masterpiece", "trending on artstation", "award winning", "high detail")
+    ),
+    "Fantasy": ", ".join(("fantasy art", "dramatic lighting", "epic composition", "detailed")),
+}
+
+_CONTEXTS: dict[str, str] = {
+    "Tavern Scene": "standing in a medieval tavern, warm firelight, wooden interior",
+    "Market Square": "in a busy marketplace, merchant stall background, daytime",
+    "Dark Alley": "in a shadowy alley, foggy atmosphere, nighttime, ominous",
+    "Throne Room": "in an ornate throne room, marble columns, regal setting",
+}
+
+# Rule framing each example heading
+_RULE = "=" * 70
+
+# Banner printed by main(), assembled once at import
+_HR = "═" * 68
+_BANNER = "\n".join(
+    (
+        "╔" + _HR + "╗",
+        "║" + "PIPEWORKS CONDITIONAL AXIS".center(68) + "║",
+        "║" + "IMAGE PROMPT GENERATION EXAMPLES".center(68) + "║",
+        "╚" + _HR + "╝",
+    )
+)
+
+
+@dataclass(slots=True, frozen=True)
+class PromptBundle:
+    """One seed's conditions together with their serialized prompts.
+
+    Examples that render several prompt variants for the same character
+    (styles, presets, contexts) convert the conditions once, here, and
+    reuse the three base prompts for every variant.
+
+    Attributes:
+        character: Character condition dict.
+        facial: Facial condition dict (empty if no facial signal).
+        occupation: Occupation condition dict.
+        char_prompt: condition_to_prompt(character).
+        face_prompt: condition_to_prompt(facial).
+        occ_prompt: occupation_condition_to_prompt(occupation).
+    """
+
+    character: dict[str, str]
+    facial: dict[str, str]
+    occupation: dict[str, str]
+    char_prompt: str
+    face_prompt: str
+    occ_prompt: str
+
+
+def _facial_from(character: dict[str, str]) -> dict[str, str]:
+    """Extract the facial condition from a character with one lookup.
+
+    Args:
+        character: Character condition dictionary (may include facial_signal).
+
+    Returns:
+        {"facial_signal": ...} when the character has one, otherwise {}.
+    """
+    signal = character.get("facial_signal")
+    return {"facial_signal": signal} if signal else {}
+
+
+def _bundle(seed: int) -> PromptBundle:
+    """Generate a seed's conditions and serialize them once.
+
+    Args:
+        seed: Random seed for reproducible generation.
+
+    Returns:
+        PromptBundle for the seed (a new instance on every call).
+    """
+    character = generate_condition(seed=seed)
+    facial = _facial_from(character)
+    occupation = generate_occupation_condition(seed=seed)
+    return PromptBundle(
+        character=character,
+        facial=facial,
+        occupation=occupation,
+        char_prompt=condition_to_prompt(character),
+        face_prompt=condition_to_prompt(facial),
+        occ_prompt=occupation_condition_to_prompt(occupation),
+    )
+
 
 def build_full_prompt(
     character: dict[str, str],
     facial: dict[str, str],
     occupation: dict[str, str],
     style: str = "",
-    quality_tags: list[str] | None = None,
+    quality_tags: list[str] | str | None = None,
     additional_details: str = "",
 ) -> str:
     """Build a complete image generation prompt from conditions.
@@ -36,7 +154,8 @@ def build_full_prompt(
         facial: Facial condition dictionary.
         occupation: Occupation condition dictionary.
         style: Optional style modifier (e.g., "oil painting", "3d render").
-        quality_tags: Optional quality/technical tags.
+        quality_tags: Optional quality/technical tags, as a list or as one
+            pre-joined string (e.g. a preset reused across many prompts).
         additional_details: Optional additional descriptive text.
 
     Returns:
@@ -49,27 +168,77 @@ def build_full_prompt(
         >>> build_full_prompt(char, facial, occ, style="portrait")
         'portrait, wiry, poor, weathered, tolerated, ...'
     """
-    # Convert conditions to prompts
-    char_prompt = condition_to_prompt(character)
-    face_prompt = condition_to_prompt(facial)
-    occ_prompt = occupation_condition_to_prompt(occupation)
+    return _assemble_prompt(
+        condition_to_prompt(character),
+        condition_to_prompt(facial),
+        occupation_condition_to_prompt(occupation),
+        style,
+        quality_tags,
+        additional_details,
+    )
+
+
+def build_prompt_from_bundle(
+    bundle: PromptBundle,
+    style: str = "",
+    quality_tags: list[str] | str | None = None,
+    additional_details: str = "",
+) -> str:
+    """Build an image prompt from a bundle's precomputed condition prompts.
 
-    # Combine base components
-    parts = [char_prompt, face_prompt, occ_prompt]
+    Same result as build_full_prompt() on the bundle's conditions, without
+    serializing them again.
 
-    # Add additional details if provided
-    if additional_details:
-        parts.append(additional_details)
+    Args:
+        bundle: Conditions and prompts from _bundle().
+        style: Optional style modifier (e.g., "oil painting", "3d render").
+        quality_tags: Optional quality/technical tags (list or pre-joined str).
+        additional_details: Optional additional descriptive text.
 
-    # Add style modifier
-    if style:
-        parts.insert(0, style)
+    Returns:
+        Complete prompt string optimized for image generation.
+    """
+    return _assemble_prompt(
+        bundle.char_prompt,
+        bundle.face_prompt,
+        bundle.occ_prompt,
+        style,
+        quality_tags,
+        additional_details,
+    )
 
-    # Add quality tags
-    if quality_tags:
-        parts.extend(quality_tags)
 
-    # Join with comma separation
+def _assemble_prompt(
+    char_prompt: str,
+    face_prompt: str,
+    occ_prompt: str,
+    style: str,
+    quality_tags: list[str] | str | None,
+    additional_details: str,
+) -> str:
+    """Join prompt parts in order: style, conditions, details, quality tags.
+
+    Args:
+        char_prompt: Serialized character conditions.
+        face_prompt: Serialized facial conditions.
+        occ_prompt: Serialized occupation conditions.
+        style: Style modifier, or "".
+        quality_tags: Quality/technical tags, a pre-joined tag string, or None.
+        additional_details: Additional descriptive text, or "".
+
+    Returns:
+        Comma-separated prompt with empty parts skipped.
+    """
+    if isinstance(quality_tags, str):
+        quality_tags = [quality_tags]
+    parts = (
+        style,
+        char_prompt,
+        face_prompt,
+        occ_prompt,
+        additional_details,
+        *(quality_tags or ()),
+    )
     return ", ".join(filter(None, parts))
 
 
@@ -89,44 +258,28 @@ def build_negative_prompt(avoid_traits: list[str] | None = None) -> str:
         >>> build_negative_prompt(["cartoonish", "anime"])
         'cartoonish, anime, low quality, ...'
     """
-    # Common quality issues to avoid
-    base_negatives = [
-        "low quality",
-        "blurry",
-        "distorted",
-        "deformed",
-        "duplicate",
-        "watermark",
-    ]
+    if not avoid_traits:
+        return _BASE_NEGATIVES_PROMPT
 
-    if avoid_traits:
-        base_negatives.extend(avoid_traits)
-
-    return ", ".join(base_negatives)
+    return f"{_BASE_NEGATIVES_PROMPT}, {', '.join(avoid_traits)}"
 
 
 def example_1_basic_image_prompt() -> None:
     """Demonstrate converting conditions to a basic image prompt."""
-    print("=" * 70)
+    print(_RULE)
     print("EXAMPLE 1: Basic Image Prompt Generation")
-    print("=" * 70)
+    print(_RULE)
 
     seed = 42
-    character = generate_condition(seed=seed)
-    facial = (
-        {"facial_signal": character.get("facial_signal", "")}
-        if "facial_signal" in character
-        else {}
-    )
-    occupation = generate_occupation_condition(seed=seed)
+    bundle = _bundle(seed)
 
     print("\nGenerated Conditions:")
-    print(f"  Character: {character}")
-    print(f"  Facial: {facial}")
-    print(f"  Occupation: {occupation}")
+    print(f"  Character: {bundle.character}")
+    print(f"  Facial: {bundle.facial}")
+    print(f"  Occupation: {bundle.occupation}")
 
     # Basic prompt
-    basic_prompt = build_full_prompt(character, facial, occupation)
+    basic_prompt = build_prompt_from_bundle(bundle)
 
     print("\nBasic Image Prompt:")
     print(f"  '{basic_prompt}'")
@@ -140,103 +293,55 @@ def example_1_basic_image_prompt() -> None:
 
 def example_2_styled_prompts() -> None:
     """Demonstrate adding style modifiers to prompts."""
-    print("\n" + "=" * 70)
+    print("\n" + _RULE)
     print("EXAMPLE 2: Styled Image Prompts")
-    print("=" * 70)
+    print(_RULE)
 
     seed = 99
-    character = generate_condition(seed=seed)
-    facial = (
-        {"facial_signal": character.get("facial_signal", "")}
-        if "facial_signal" in character
-        else {}
-    )
-    occupation = generate_occupation_condition(seed=seed)
-
-    styles = [
-        "portrait photograph",
-        "oil painting",
-        "pencil sketch",
-        "3d render, octane",
-        "watercolor illustration",
-        "digital art, concept art",
-    ]
+    bundle = _bundle(seed)
 
     print("\nSame character in different styles:\n")
 
-    for style in styles:
-        prompt = build_full_prompt(character, facial, occupation, style=style)
-        print(f"  {style.upper()}:")
-        print(f"    {prompt}\n")
+    # Collect the report lines and write them with one print call
+    lines = []
+    for style in _STYLES:
+        prompt = build_prompt_from_bundle(bundle, style=style)
+        lines.append(f"  {style.upper()}:")
+        lines.append(f"    {prompt}\n")
+    print("\n".join(lines))
 
 
 def example_3_quality_enhanced_prompts() -> None:
     """Demonstrate adding quality tags for better results."""
-    print("\n" + "=" * 70)
+    print("\n" + _RULE)
     print("EXAMPLE 3: Quality-Enhanced Prompts")
-    print("=" * 70)
+    print(_RULE)
 
     seed = 777
-    character = generate_condition(seed=seed)
-    facial = (
-        {"facial_signal": character.get("facial_signal", "")}
-        if "facial_signal" in character
-        else {}
-    )
-    occupation = generate_occupation_condition(seed=seed)
-
-    # Different quality tag sets for different needs
-    quality_presets = {
-        "Photorealistic": [
-            "highly detailed",
-            "8k resolution",
-            "photorealistic",
-            "professional photography",
-        ],
-        "Artistic": [
-            "masterpiece",
-            "trending on artstation",
-            "award winning",
-            "high detail",
-        ],
-        "Fantasy": [
-            "fantasy art",
-            "dramatic lighting",
-            "epic composition",
-            "detailed",
-        ],
-    }
+    bundle = _bundle(seed)
 
     print("\nSame character with different quality presets:\n")
 
-    for preset_name, quality_tags in quality_presets.items():
-        prompt = build_full_prompt(
-            character, facial, occupation, style="portrait", quality_tags=quality_tags
-        )
-        print(f"  {preset_name.upper()} PRESET:")
-        print(f"    {prompt}\n")
+    lines = []
+    for preset_name, quality_tags in _QUALITY_PRESETS.items():
+        prompt = build_prompt_from_bundle(bundle, style="portrait", quality_tags=quality_tags)
+        lines.append(f"  {preset_name.upper()} PRESET:")
+        lines.append(f"    {prompt}\n")
+    print("\n".join(lines))
 
 
 def example_4_with_negative_prompts() -> None:
     """Demonstrate using negative prompts for better control."""
-    print("\n" + "=" * 70)
+    print("\n" + _RULE)
     print("EXAMPLE 4: Positive and Negative Prompts")
-    print("=" * 70)
+    print(_RULE)
 
     seed = 123
-    character = generate_condition(seed=seed)
-    facial = (
-        {"facial_signal": character.get("facial_signal", "")}
-        if "facial_signal" in character
-        else {}
-    )
-    occupation = generate_occupation_condition(seed=seed)
+    bundle = _bundle(seed)
 
     # Build positive prompt
-    positive_prompt = build_full_prompt(
-        character,
-        facial,
-        occupation,
+    positive_prompt = build_prompt_from_bundle(
+        bundle,
         style="realistic portrait photograph",
         quality_tags=["highly detailed", "professional lighting"],
     )
@@ -261,80 +366,56 @@ def example_4_with_negative_prompts() -> None:
 
 def example_5_batch_prompt_generation() -> None:
     """Demonstrate generating a batch of prompts for a character set."""
-    print("\n" + "=" * 70)
+    print("\n" + _RULE)
     print("EXAMPLE 5: Batch Prompt Generation")
-    print("=" * 70)
+    print(_RULE)
 
     print("\nGenerating prompts for a party of 4 adventurers:\n")
 
     base_style = "fantasy character portrait"
-    quality_tags = ["detailed", "dramatic lighting", "trending on artstation"]
+    # Joined once here rather than once per adventurer
+    quality_tags = ", ".join(["detailed", "dramatic lighting", "trending on artstation"])
 
+    lines = []
     for i in range(4):
         seed = 1000 + i
-        character = generate_condition(seed=seed)
-        facial = (
-            {"facial_signal": character.get("facial_signal", "")}
-            if "facial_signal" in character
-            else {}
-        )
-        occupation = generate_occupation_condition(seed=seed)
+        bundle = _bundle(seed)
 
-        prompt = build_full_prompt(
-            character, facial, occupation, style=base_style, quality_tags=quality_tags
-        )
+        prompt = build_prompt_from_bundle(bundle, style=base_style, quality_tags=quality_tags)
 
-        print(f"ADVENTURER {i + 1} (seed={seed}):")
-        print(f"  {prompt}\n")
+        lines.append(f"ADVENTURER {i + 1} (seed={seed}):")
+        lines.append(f"  {prompt}\n")
+    print("\n".join(lines))
 
     print("These prompts maintain consistent style while varying character traits.")
 
 
 def example_6_context_specific_additions() -> None:
     """Demonstrate adding context-specific details to prompts."""
-    print("\n" + "=" * 70)
+    print("\n" + _RULE)
     print("EXAMPLE 6: Context-Specific Additions")
-    print("=" * 70)
+    print(_RULE)
 
     seed = 456
-    character = generate_condition(seed=seed)
-    facial = (
-        {"facial_signal": character.get("facial_signal", "")}
-        if "facial_signal" in character
-        else {}
-    )
-    occupation = generate_occupation_condition(seed=seed)
-
-    contexts = {
-        "Tavern Scene": "standing in a medieval tavern, warm firelight, wooden interior",
-        "Market Square": "in a busy marketplace, merchant stall background, daytime",
-        "Dark Alley": "in a shadowy alley, foggy atmosphere, nighttime, ominous",
-        "Throne Room": "in an ornate throne room, marble columns, regal setting",
-    }
+    bundle = _bundle(seed)
 
     print("\nSame character in different contexts:\n")
 
-    for context_name, context_details in contexts.items():
-        prompt = build_full_prompt(
-            character,
-            facial,
-            occupation,
+    lines = []
+    for context_name, context_details in _CONTEXTS.items():
+        prompt = build_prompt_from_bundle(
+            bundle,
             style="cinematic portrait",
             additional_details=context_details,
         )
 
-        print(f"  {context_name.upper()}:")
-        print(f"    {prompt}\n")
+        lines.append(f"  {context_name.upper()}:")
+        lines.append(f"    {prompt}\n")
+    print("\n".join(lines))
 
 
-def example_7_prompt_engineering_tips() -> None:
-    """Provide prompt engineering tips and best practices."""
-    print("\n" + "=" * 70)
-    print("EXAMPLE 7: Prompt Engineering Best Practices")
-    print("=" * 70)
-
-    print(
-        """
+# Printed verbatim by example 7
+_BEST_PRACTICES = """
 ╔══════════════════════════════════════════════════════════════════╗
 ║              IMAGE GENERATION PROMPT BEST PRACTICES              ║
 ╚══════════════════════════════════════════════════════════════════╝
@@ -418,21 +499,39 @@ def example_7_prompt_engineering_tips() -> None:
 ║               READY TO GENERATE AMAZING CHARACTERS!              ║
 ╚══════════════════════════════════════════════════════════════════╝
     """
-    )
 
 
-def main() -> None:
+def example_7_prompt_engineering_tips() -> None:
+    """Provide prompt engineering tips and best practices."""
+    print("\n" + _RULE)
+    print("EXAMPLE 7: Prompt Engineering Best Practices")
+    print(_RULE)
+
+    print(_BEST_PRACTICES)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
     """Run all image prompt generation examples.
 
     This main function executes all examples demonstrating how to
     convert condition axis data into optimized prompts for AI image
     generation tools.
+
+    Args:
+        argv: Command-line arguments, defaulting to sys.argv[1:]. Pass
+            --no-tips to skip the static best-practices text of example 7,
+            e.g. when timing the examples.
     """
+    parser = argparse.ArgumentParser(description="Run the image prompt generation examples.")
+    parser.add_argument(
+        "--no-tips",
+        action="store_true",
+        help="skip example 7 (prompt engineering best practices)",
+    )
+    args = parser.parse_args(argv)
+
     print("\n")
-    print("╔" + "═" * 68 + "╗")
-    print("║" + " " * 15 + "PIPEWORKS CONDITIONAL AXIS" + " " * 27 + "║")
-    print("║" + " " * 13 + "IMAGE PROMPT GENERATION EXAMPLES" + " " * 21 + "║")
-    print("╚" + "═" * 68 + "╝")
+    print(_BANNER)
 
     example_1_basic_image_prompt()
     example_2_styled_prompts()
@@ -440,11 +539,12 @@ def main() -> None:
     example_4_with_negative_prompts()
     example_5_batch_prompt_generation()
     example_6_context_specific_additions()
-    example_7_prompt_engineering_tips()
+    if not args.no_tips:
+        example_7_prompt_engineering_tips()
 
-    print("\n" + "=" * 70)
+    print("\n" + _RULE)
     print("All image prompt generation examples completed successfully!")
-    print("=" * 70)
+    print(_RULE)
     print("\nKey Takeaways:")
     print("  - Conditions convert naturally to visual descriptors")
     print("  - Style modifiers control artistic interpretation")
@@ -12,10 +12,19 @@ Run this example:
     python examples/integration_example.py
 """
 
+import random
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+from types import MappingProxyType
+
 from condition_axis import (
     condition_to_prompt,
     generate_condition,
+    generate_condition_with_rng,
     generate_occupation_condition,
+    generate_occupation_condition_with_rng,
     occupation_condition_to_prompt,
 )
 
@@ -38,48 +47,177 @@ from condition_axis import (
 # See examples/migration_guide.py for migration patterns.
 # ============================================================================
 
+# Seed sweeps reseed this one generator instead of allocating a Random per
+# seed; generate_condition_with_rng(_RNG) then matches generate_condition(seed),
+# and likewise for generate_occupation_condition_with_rng().
+_RNG = random.Random()
+
+# Wealth values example 4 pairs with illicit occupations
+_WEALTHY: frozenset[str] = frozenset({"wealthy", "decadent"})
+
+# Value groups the example 5 archetype predicates test against
+_HEALTH_BAD: frozenset[str] = frozenset({"weary", "scarred"})
+_RISK_HIGH: frozenset[str] = frozenset({"hazardous", "eroding"})
+_WEALTH_GOOD: frozenset[str] = frozenset({"wealthy", "well-kept"})
+_DEMEANOR_ALERT: frozenset[str] = frozenset({"alert", "proud"})
+_WEALTH_LOW: frozenset[str] = frozenset({"poor", "modest"})
+_PHYSIQUE_LEAN: frozenset[str] = frozenset({"skinny", "wiry", "hunched"})
+_MORAL_MID: frozenset[str] = frozenset({"neutral", "burdened"})
+
+# Rule framing each example heading
+_RULE = "=" * 70
+
+# Banner printed by main(), assembled once at import
+_HR = "═" * 68
+_BANNER = "\n".join(
+    (
+        "╔" + _HR + "╗",
+        "║" + "PIPEWORKS CONDITIONAL AXIS".center(68) + "║",
+        "║" + "INTEGRATION EXAMPLES".center(68) + "║",
+        "╚" + _HR + "╝",
+    )
+)
 
-def example_1_complete_entity_generation() -> None:
-    """Demonstrate generating a complete entity with all three systems.
 
-    Using the same seed across all three systems ensures consistency
-    in the random number generator state, though each system operates
-    independently.
+@lru_cache(maxsize=4096)
+def _cached_condition(seed: int) -> Mapping[str, str]:
+    """Return the character for a seed, reusing earlier results.
+
+    Examples 2, 4 and 5 scan overlapping seed ranges from 0, so each seed is
+    generated once per run. The dict is wrapped read-only so no caller can
+    mutate the cached instance.
+
+    Args:
+        seed: Random seed for reproducible generation.
+
+    Returns:
+        Read-only mapping, equal to generate_condition(seed=seed).
     """
-    print("=" * 70)
-    print("EXAMPLE 1: Complete Entity Generation")
-    print("=" * 70)
+    _RNG.seed(seed)
+    return MappingProxyType(generate_condition_with_rng(_RNG))
+
+
+@lru_cache(maxsize=4096)
+def _cached_occupation(seed: int) -> Mapping[str, str]:
+    """Return the occupation for a seed, reusing earlier results.
+
+    Args:
+        seed: Random seed for reproducible generation.
+
+    Returns:
+        Read-only mapping, equal to generate_occupation_condition(seed=seed).
+    """
+    _RNG.seed(seed)
+    return MappingProxyType(generate_occupation_condition_with_rng(_RNG))
+
+
+def _facial_from(character: Mapping[str, str]) -> dict[str, str]:
+    """Extract the facial condition from a character with one lookup.
+
+    Args:
+        character: Character condition dictionary (may include facial_signal).
+
+    Returns:
+        {"facial_signal": ...} when the character has one, otherwise {}.
+    """
+    signal = character.get("facial_signal")
+    return {"facial_signal": signal} if signal else {}
+
+
+def _combine(*parts: str) -> str:
+    """Join prompt fragments with commas, skipping empty ones.
+
+    Args:
+        *parts: Prompt strings (an empty condition serializes to "").
+
+    Returns:
+        Comma-separated prompt without stray ", , " gaps.
+    """
+    return ", ".join([part for part in parts if part])
 
-    seed = 42
 
+@dataclass(slots=True, frozen=True)
+class RenderedEntity:
+    """One seed's conditions together with their serialized prompts.
+
+    Attributes:
+        character: Character conditions.
+        facial: Facial conditions (derived from the character).
+        occupation: Occupation conditions.
+        char_prompt: Serialized character prompt.
+        face_prompt: Serialized facial prompt.
+        occ_prompt: Serialized occupation prompt.
+        full_prompt: The three prompts combined, skipping empty ones.
+    """
+
+    character: dict[str, str]
+    facial: dict[str, str]
+    occupation: dict[str, str]
+    char_prompt: str
+    face_prompt: str
+    occ_prompt: str
+    full_prompt: str
+
+
+def _render(seed: int) -> RenderedEntity:
+    """Generate and serialize a complete entity.
+
+    Args:
+        seed: Random seed used for all three systems.
+
+    Returns:
+        RenderedEntity for the seed (a new instance on every call).
+    """
     # Generate all three condition types with the same seed
     character = generate_condition(seed=seed)
-    facial = (
-        {"facial_signal": character.get("facial_signal", "")}
-        if "facial_signal" in character
-        else {}
-    )
+    facial = _facial_from(character)
     occupation = generate_occupation_condition(seed=seed)
 
-    print(f"\nEntity (seed={seed}):")
-    print(f"\nCharacter Conditions: {character}")
-    print(f"Facial Conditions: {facial}")
-    print(f"Occupation Conditions: {occupation}")
-
     # Convert to prompts
     char_prompt = condition_to_prompt(character)
     face_prompt = condition_to_prompt(facial)
     occ_prompt = occupation_condition_to_prompt(occupation)
+    return RenderedEntity(
+        character=character,
+        facial=facial,
+        occupation=occupation,
+        char_prompt=char_prompt,
+        face_prompt=face_prompt,
+        occ_prompt=occ_prompt,
+        full_prompt=_combine(char_prompt, face_prompt, occ_prompt),
+    )
+
+
+def example_1_complete_entity_generation() -> None:
+    """Demonstrate generating a complete entity with all three systems.
+
+    Using the same seed across all three systems ensures consistency
+    in the random number generator state, though each system operates
+    independently.
+    """
+    print(_RULE)
+    print("EXAMPLE 1: Complete Entity Generation")
+    print(_RULE)
 
-    print("\nSerialized Prompts:")
-    print(f"  Character: {char_prompt}")
-    print(f"  Facial: {face_prompt}")
-    print(f"  Occupation: {occ_prompt}")
+    seed = 42
 
-    # Combined prompt for image generation or narrative
-    full_prompt = f"{char_prompt}, {face_prompt}, {occ_prompt}"
-    print("\nCombined Prompt:")
-    print(f"  '{full_prompt}'")
+    # Generate and serialize all three condition types with the same seed
+    entity = _render(seed)
+
+    # Write the whole report with one print call
+    lines = (
+        f"\nEntity (seed={seed}):",
+        f"\nCharacter Conditions: {entity.character}",
+        f"Facial Conditions: {entity.facial}",
+        f"Occupation Conditions: {entity.occupation}",
+        "\nSerialized Prompts:",
+        f"  Character: {entity.char_prompt}",
+        f"  Facial: {entity.face_prompt}",
+        f"  Occupation: {entity.occ_prompt}",
+        "\nCombined Prompt:",
+        f"  '{entity.full_prompt}'",
+    )
+    print("\n".join(lines))
 
 
 def example_2_multiple_complete_entities() -> None:
@@ -88,34 +226,23 @@ def example_2_multiple_complete_entities() -> None:
     Each entity gets a unique seed to ensure distinct characteristics
     across all three systems.
     """
-    print("\n" + "=" * 70)
+    print("\n" + _RULE)
     print("EXAMPLE 2: Multiple Complete Entities")
-    print("=" * 70)
-
-    entities = []
-    for seed in range(5):
-        char = generate_condition(seed=seed)
-        entity = {
-            "seed": seed,
-            "character": char,
-            "facial": (
-                {"facial_signal": char.get("facial_signal", "")} if "facial_signal" in char else {}
-            ),
-            "occupation": generate_occupation_condition(seed=seed),
-        }
-        entities.append(entity)
+    print(_RULE)
 
     print("\nGenerated Population (5 entities):\n")
 
-    for entity in entities:
-        seed = entity["seed"]
-        char_prompt = condition_to_prompt(entity["character"])
-        face_prompt = condition_to_prompt(entity["facial"])
-        occ_prompt = occupation_condition_to_prompt(entity["occupation"])
-
-        full_prompt = f"{char_prompt}, {face_prompt}, {occ_prompt}"
-
-        print(f"Entity #{seed}: {full_prompt}")
+    # Collect the report lines and write them with one print call
+    lines = []
+    for seed in range(5):
+        character = _cached_condition(seed)
+        full_prompt = _combine(
+            condition_to_prompt(character),
+            condition_to_prompt(_facial_from(character)),
+            occupation_condition_to_prompt(_cached_occupation(seed)),
+        )
+        lines.append(f"Entity #{seed}: {full_prompt}")
+    print("\n".join(lines))
 
 
 def example_3_narrative_vs_visual_formatting() -> None:
@@ -127,41 +254,95 @@ def example_3_narrative_vs_visual_formatting() -> None:
     - Narrative description (natural language)
     - Data storage (structured dict)
     """
-    print("\n" + "=" * 70)
+    print("\n" + _RULE)
     print("EXAMPLE 3: Narrative vs Visual Formatting")
-    print("=" * 70)
+    print(_RULE)
 
     seed = 777
 
-    character = generate_condition(seed=seed)
-    facial = (
-        {"facial_signal": character.get("facial_signal", "")}
-        if "facial_signal" in character
-        else {}
-    )
-    occupation = generate_occupation_condition(seed=seed)
+    entity = _render(seed)
 
     # 1. Structured data (for storage/transmission)
-    print("\n1. STRUCTURED DATA (JSON-ready):")
     structured = {
-        "character": character,
-        "facial": facial,
-        "occupation": occupation,
+        "character": entity.character,
+        "facial": entity.facial,
+        "occupation": entity.occupation,
     }
-    print(f"   {structured}")
 
     # 2. Visual prompt (for image generation)
-    print("\n2. VISUAL PROMPT (for Stable Diffusion, DALL-E, etc.):")
-    char_prompt = condition_to_prompt(character)
-    face_prompt = condition_to_prompt(facial)
-    occ_prompt = occupation_condition_to_prompt(occupation)
-    visual_prompt = f"{char_prompt}, {face_prompt}, {occ_prompt}"
-    print(f"   '{visual_prompt}'")
+    visual_prompt = entity.full_prompt
 
     # 3. Narrative description (for text-based content)
-    print("\n3. NARRATIVE DESCRIPTION (for MUDs, interactive fiction):")
-    narrative = format_as_narrative(character, facial, occupation)
-    print(f"   {narrative}")
+    narrative = format_as_narrative(entity.character, entity.facial, entity.occupation)
+
+    # Write all three formats with one print call
+    lines = (
+        "\n1. STRUCTURED DATA (JSON-ready):",
+        f"   {structured}",
+        "\n2. VISUAL PROMPT (for Stable Diffusion, DALL-E, etc.):",
+        f"   '{visual_prompt}'",
+        "\n3. NARRATIVE DESCRIPTION (for MUDs, interactive fiction):",
+        f"   {narrative}",
+    )
+    print("\n".join(lines))
+
+
+def _narrative_template(
+    physique: bool,
+    wealth: bool,
+    facial_signal: bool,
+    health: bool,
+    legitimacy: bool,
+    visibility: bool,
+) -> str:
+    """Build the format_as_narrative() template for one set of present fields.
+
+    Args:
+        physique: Whether the entity has a physique value.
+        wealth: Whether the entity has a wealth value.
+        facial_signal: Whether the entity has a facial signal.
+        health: Whether the entity has a health value.
+        legitimacy: Whether the entity has an occupation legitimacy.
+        visibility: Whether the entity has an occupation visibility.
+
+    Returns:
+        str.format template with a named field for each present value.
+    """
+    parts = []
+
+    # Physical description
+    if physique and wealth:
+        parts.append("A {physique}, {wealth} individual")
+    elif physique:
+        parts.append("A {physique} individual")
+
+    # Facial features (updated to use facial_signal instead of overall_impression)
+    if facial_signal:
+        parts.append("with a {facial_signal} face")
+
+    # Health and demeanor
+    if health:
+        parts.append("bearing signs of being {health}")
+
+    # Occupation characteristics
+    occ_parts = []
+    if legitimacy:
+        occ_parts.append("{legitimacy} work")
+    if visibility:
+        occ_parts.append("{visibility} presence")
+
+    if occ_parts:
+        parts.append(f"whose {' and '.join(occ_parts)} suggests careful positioning")
+
+    return ". ".join(parts) + "."
+
+
+# One narrative template per combination of present fields, built once at
+# import. The index is a bitmask over (physique, wealth, facial_signal, health,
+# legitimacy, visibility), with physique as the most significant bit.
+_NARRATIVE_TEMPLATES: tuple[str, ...] = tuple(
+    _narrative_template(*present) for present in product((False, True), repeat=6)
+)
 
 
 def format_as_narrative(
@@ -202,34 +383,44 @@ def format_as_narrative(
     legitimacy = occupation.get("legitimacy", "")
     visibility = occupation.get("visibility", "")
 
-    # Build narrative
-    parts = []
-
-    # Physical description
-    if physique and wealth:
-        parts.append(f"A {physique}, {wealth} individual")
-    elif physique:
-        parts.append(f"A {physique} individual")
-
-    # Facial features (updated to use facial_signal instead of overall_impression)
-    if facial_signal:
-        parts.append(f"with a {facial_signal} face")
+    # Each combination of present fields has its own precomputed template,
+    # so the sentence is produced by a single format call
+    mask = (
+        bool(physique) << 5
+        | bool(wealth) << 4
+        | bool(facial_signal) << 3
+        | bool(health) << 2
+        | bool(legitimacy) << 1
+        | bool(visibility)
+    )
+    return _NARRATIVE_TEMPLATES[mask].format(
+        physique=physique,
+        wealth=wealth,
+        facial_signal=facial_signal,
+        health=health,
+        legitimacy=legitimacy,
+        visibility=visibility,
+    )
 
-    # Health and demeanor
-    if health:
-        parts.append(f"bearing signs of being {health}")
 
-    # Occupation characteristics
-    occ_parts = []
-    if legitimacy:
-        occ_parts.append(f"{legitimacy} work")
-    if visibility:
-        occ_parts.append(f"{visibility} presence")
+def _coherence_pattern(character: Mapping[str, str], occupation: Mapping[str, str]) -> str | None:
+    """Name the cross-system pattern an entity shows, if any.
 
-    if occ_parts:
-        parts.append(f"whose {' and '.join(occ_parts)} suggests careful positioning")
+    Args:
+        character: Character condition dictionary (may include facial_signal).
+        occupation: Occupation condition dictionary.
 
-    return ". ".join(parts) + "."
+    Returns:
+        "wealthy_illicit", "young_weathered" or "contradictory", checked in
+        that order, or None when the entity fits none of them.
+    """
+    if character.get("wealth") in _WEALTHY and occupation.get("legitimacy") == "illicit":
+        return "wealthy_illicit"
+    if character.get("age") == "young" and character.get("facial_signal") == "weathered":
+        return "young_weathered"
+    if occupation.get("visibility") == "hidden" and character.get("demeanor") == "proud":
+        return "contradictory"
+    return None
 
 
 def example_4_identifying_coherence_patterns() -> None:
@@ -238,56 +429,31 @@ def example_4_identifying_coherence_patterns() -> None:
     While each system operates independently, some cross-system
     combinations create more or less coherent narratives.
     """
-    print("\n" + "=" * 70)
+    print("\n" + _RULE)
     print("EXAMPLE 4: Identifying Coherence Patterns")
-    print("=" * 70)
+    print(_RULE)
 
     print("\nSearching for interesting combinations (seeds 0-50)...")
 
     interesting_cases = []
-
     for seed in range(50):
-        character = generate_condition(seed=seed)
-        facial = (
-            {"facial_signal": character.get("facial_signal", "")}
-            if "facial_signal" in character
-            else {}
-        )
-        occupation = generate_occupation_condition(seed=seed)
-
-        # Look for specific patterns
-        is_wealthy_illicit = (
-            character.get("wealth") in ["wealthy", "decadent"]
-            and occupation.get("legitimacy") == "illicit"
-        )
-
-        is_young_weathered = (
-            character.get("age") == "young" and facial.get("facial_signal") == "weathered"
-        )
-
-        is_conspicuous_hidden = (
-            occupation.get("visibility") == "hidden" and character.get("demeanor") == "proud"
-        )
-
-        if is_wealthy_illicit or is_young_weathered or is_conspicuous_hidden:
+        character = _cached_condition(seed)
+        occupation = _cached_occupation(seed)
+        pattern = _coherence_pattern(character, occupation)
+        if pattern is not None:
             interesting_cases.append(
                 {
                     "seed": seed,
                     "character": character,
-                    "facial": facial,
+                    "facial": _facial_from(character),
                     "occupation": occupation,
-                    "pattern": (
-                        "wealthy_illicit"
-                        if is_wealthy_illicit
-                        else "young_weathered"
-                        if is_young_weathered
-                        else "contradictory"
-                    ),
+                    "pattern": pattern,
                 }
             )
 
     print(f"\nFound {len(interesting_cases)} interesting patterns:\n")
 
+    lines = []
     for case in interesting_cases[:3]:  # Show first 3
         seed = case["seed"]
         pattern = case["pattern"]
@@ -295,9 +461,11 @@ def example_4_identifying_coherence_patterns() -> None:
         face_prompt = condition_to_prompt(case["facial"])
         occ_prompt = occupation_condition_to_prompt(case["occupation"])
 
-        print(f"Seed {seed} ({pattern}):")
-        print(f"  {char_prompt}, {face_prompt}, {occ_prompt}")
-        print()
+        lines.append(f"Seed {seed} ({pattern}):")
+        lines.append(f"  {_combine(char_prompt, face_prompt, occ_prompt)}")
+        lines.append("")
+    if lines:
+        print("\n".join(lines))
 
 
 def example_5_entity_archetype_generation() -> None:
@@ -306,61 +474,76 @@ def example_5_entity_archetype_generation() -> None:
     By generating many entities and filtering for desired traits,
     you can find entities that match specific narrative archetypes.
     """
-    print("\n" + "=" * 70)
+    print("\n" + _RULE)
     print("EXAMPLE 5: Entity Archetype Generation")
-    print("=" * 70)
+    print(_RULE)
 
     archetypes = {
         "The Desperate Outlaw": {
-            "character": lambda c: c.get("wealth") == "poor"
-            and c.get("health") in ["weary", "scarred"],
+            "character": lambda c: c.get("wealth") == "poor" and c.get("health") in _HEALTH_BAD,
             "occupation": lambda o: o.get("legitimacy") == "illicit"
-            and o.get("risk_exposure") in ["hazardous", "eroding"],
+            and o.get("risk_exposure") in _RISK_HIGH,
         },
         "The Respected Merchant": {
-            "character": lambda c: c.get("wealth") in ["wealthy", "well-kept"]
-            and c.get("demeanor") in ["alert", "proud"],
+            "character": lambda c: c.get("wealth") in _WEALTH_GOOD
+            and c.get("demeanor") in _DEMEANOR_ALERT,
             "occupation": lambda o: o.get("legitimacy") == "sanctioned"
             and o.get("visibility") == "routine",
         },
         "The Hidden Scholar": {
-            "character": lambda c: c.get("wealth") in ["poor", "modest"]
-            and c.get("physique") in ["skinny", "wiry", "hunched"],
+            "character": lambda c: c.get("wealth") in _WEALTH_LOW
+            and c.get("physique") in _PHYSIQUE_LEAN,
             "occupation": lambda o: o.get("visibility") == "hidden"
-            and o.get("moral_load") in ["neutral", "burdened"],
+            and o.get("moral_load") in _MORAL_MID,
         },
     }
 
     print("\nSearching for archetype matches (seeds 0-1000000)...\n")
 
-    for archetype_name, criteria in archetypes.items():
-        print(f"=== {archetype_name} ===")
-
-        found = False
-        for seed in range(1000000):
-            character = generate_condition(seed=seed)
-            facial = (
-                {"facial_signal": character.get("facial_signal", "")}
-                if "facial_signal" in character
-                else {}
-            )
-            occupation = generate_occupation_condition(seed=seed)
-
-            char_match = criteria["character"](character)
-            occ_match = criteria["occupation"](occupation)
-
-            if char_match and occ_match:
-                char_prompt = condition_to_prompt(character)
-                face_prompt = condition_to_prompt(facial)
-                occ_prompt = occupation_condition_to_prompt(occupation)
+    # Bind the per-seed calls to locals once, outside the seed loop
+    draw_character = _cached_condition
+    draw_occupation = _cached_occupation
+
+    # One pass over the seeds tests every archetype still unmatched, so each
+    # seed is generated once rather than once per archetype. Predicates are
+    # checked as soon as their condition exists: most seeds never generate
+    # an occupation or a facial dict.
+    pending = {
+        name: (criteria["character"], criteria["occupation"])
+        for name, criteria in archetypes.items()
+    }
+    matches: dict[str, str] = {}
+
+    for seed in range(1000000):
+        character = draw_character(seed)
+        candidates = [name for name, (char_pred, _) in pending.items() if char_pred(character)]
+        if not candidates:
+            continue
+
+        occupation = draw_occupation(seed)
+        matched = [name for name in candidates if pending[name][1](occupation)]
+        if not matched:
+            continue
+
+        full_prompt = _combine(
+            condition_to_prompt(character),
+            condition_to_prompt(_facial_from(character)),
+            occupation_condition_to_prompt(occupation),
+        )
+        line = f"  Seed {seed}: {full_prompt}"
 
-                print(f"  Seed {seed}: {char_prompt}, {face_prompt}, {occ_prompt}")
-                found = True
-                break
+        for name in matched:
+            matches[name] = line
+            del pending[name]
+        if not pending:
+            break
 
-        if not found:
-            print("  No match found in seeds 0-1000000")
-        print()
+    lines = []
+    for archetype_name in archetypes:
+        lines.append(f"=== {archetype_name} ===")
+        lines.append(matches.get(archetype_name, "  No match found in seeds 0-1000000"))
+        lines.append("")
+    print("\n".join(lines))
 
 
 def main() -> None:
@@ -371,10 +554,7 @@ def main() -> None:
     for complete entity generation.
     """
     print("\n")
-    print("╔" + "═" * 68 + "╗")
-    print("║" + " " * 15 + "PIPEWORKS CONDITIONAL AXIS" + " " * 27 + "║")
-    print("║" + " " * 17 + "INTEGRATION EXAMPLES" + " " * 31 + "║")
-    print("╚" + "═" * 68 + "╝")
+    print(_BANNER)
 
     example_1_complete_entity_generation()
     example_2_multiple_complete_entities()
@@ -382,9 +562,9 @@ def main() -> None:
     example_4_identifying_coherence_patterns()
     example_5_entity_archetype_generation()
 
-    print("\n" + "=" * 70)
+    print("\n" + _RULE)
     print("All integration examples completed successfully!")
-    print("=" * 70)
+    print(_RULE)
     print("\nKey Takeaways:")
     print("  - All three systems can be combined with the same seed")
     print("  - Each system operates independently but creates coherent wholes")
@@ -47,13 +47,21 @@ Example usage:
 # ============================================================================
 from .character_conditions import (
     AXIS_POLICY,
+    AXIS_VALUE_INDEX,
+    AXIS_VALUES,
     CONDITION_AXES,
     EXCLUSIONS,
+    MANDATORY_SET,
+    OPTIONAL_SET,
     WEIGHTS,
     condition_to_prompt,
     generate_condition,
+    generate_condition_with_rng,
+    generate_conditions_batch,
+    generate_conditions_range,
     get_available_axes,
     get_axis_values,
+    sample_axis,
 )
 
 # ============================================================================
@@ -65,6 +73,7 @@ from .occupation_axis import (
     OCCUPATION_POLICY,
     OCCUPATION_WEIGHTS,
     generate_occupation_condition,
+    generate_occupation_condition_with_rng,
     get_available_occupation_axes,
     get_occupation_axis_values,
     occupation_condition_to_prompt,
@@ -77,22 +86,31 @@ from .occupation_axis import (
 __all__ = [
     # Character conditions (unified API)
     "AXIS_POLICY",
+    "AXIS_VALUES",
+    "AXIS_VALUE_INDEX",
     "CONDITION_AXES",
     "EXCLUSIONS",
+    "MANDATORY_SET",
     # Occupation conditions
     "OCCUPATION_AXES",
     "OCCUPATION_EXCLUSIONS",
     "OCCUPATION_POLICY",
     "OCCUPATION_WEIGHTS",
+    "OPTIONAL_SET",
     "WEIGHTS",
     "condition_to_prompt",
     "generate_condition",
+    "generate_condition_with_rng",
+    "generate_conditions_batch",
+    "generate_conditions_range",
     "generate_occupation_condition",
+    "generate_occupation_condition_with_rng",
     "get_available_axes",
     "get_available_occupation_axes",
     "get_axis_values",
     "get_occupation_axis_values",
     "occupation_condition_to_prompt",
+    "sample_axis",
 ]
 
 __version__ = "0.10.1"
@@ -19,6 +19,7 @@ Core concepts:
 
 import logging
 import random
+from collections.abc import Mapping
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +87,156 @@ def weighted_choice(
     return rng.choices(options, weights=weight_values, k=1)[0]
 
 
+def build_alias_table(
+    options: list[str],
+    weights: dict[str, float] | None = None,
+) -> tuple[list[float], list[int]]:
+    """Build a Vose alias table for constant-time weighted sampling.
+
+    ``random.choices`` rebuilds a cumulative weight list and bisects it on
+    every call. For the static axis weights used by the generators, that work
+    can be done once up front: the alias method splits the distribution into
+    ``len(options)`` equally likely buckets, each holding at most two outcomes,
+    so a draw costs one random number and one comparison.
+
+    Args:
+        options: List of possible values. Must be non-empty.
+        weights: Optional dictionary mapping options to weights, with the same
+                semantics as :func:`weighted_choice` (missing entries default
+                to 1.0, zero weight = never selected).
+
+    Returns:
+        Tuple of ``(prob, alias)`` lists, both the same length as ``options``.
+        ``prob[i]`` is the probability of keeping bucket ``i``; otherwise the
+        draw resolves to ``alias[i]``.
+
+    Raises:
+        ValueError: If options is empty or all weights are zero.
+
+    Examples:
+        >>> build_alias_table(["a", "b"])
+        ([1.0, 1.0], [0, 1])
+
+        >>> build_alias_table(["rare", "common"], {"rare": 1.0, "common": 3.0})
+        ([0.5, 1.0], [1, 1])
+
+    Notes:
+        - Uses Vose's algorithm (small/large worklists), O(n) construction
+        - Pair with :func:`alias_choice` to sample from the table
+    """
+    n = len(options)
+    if weights:
+        weight_values = [weights.get(option, 1.0) for option in options]
+    else:
+        weight_values = [1.0] * n
+
+    total = sum(weight_values)
+    if n == 0 or total <= 0:
+        raise ValueError("Alias table requires at least one option with positive weight")
+
+    # Scale so the average bucket holds exactly 1.0 of probability mass
+    scaled = [weight * n / total for weight in weight_values]
+    prob = [1.0] * n
+    alias = list(range(n))
+
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+    # Top up each under-full bucket with mass taken from an over-full one
+    while small and large:
+        less = small.pop()
+        more = large.pop()
+        prob[less] = scaled[less]
+        alias[less] = more
+        scaled[more] = (scaled[more] + scaled[less]) - 1.0
+        if scaled[more] < 1.0:
+            small.append(more)
+        else:
+            large.append(more)
+
+    # Leftovers are full buckets (up to floating-point error); prob stays 1.0
+    return prob, alias
+
+
+def cached_alias_table(
+    cache: dict[str, tuple[list[str], list[float], list[int], int]],
+    axes: Mapping[str, list[str]],
+    weights: Mapping[str, dict[str, float]],
+    axis: str,
+) -> tuple[list[str], list[float], list[int], int] | None:
+    """Return an axis's ``(values, prob, alias, size)`` table, rebuilding it when stale.
+
+    Generators keep one alias table per axis in ``cache`` so each draw is
+    O(1). The axis definitions are public lists that callers may extend, so
+    a cached table is rebuilt whenever its axis list has been replaced or has
+    changed length since the table was built.
+
+    Args:
+        cache: Per-axis tables, updated in place when an entry is built.
+        axes: Axis definitions (e.g. CONDITION_AXES).
+        weights: Axis weights (e.g. WEIGHTS); missing axes are uniform.
+        axis: Axis to look up.
+
+    Returns:
+        ``(values, prob, alias, size)`` where ``values`` is the axis's own
+        list, or None if ``axis`` is not defined in ``axes``.
+
+    Example:
+        >>> axes = {"wealth": ["poor", "rich"]}
+        >>> cache = {}
+        >>> cached_alias_table(cache, axes, {}, "wealth")
+        (['poor', 'rich'], [1.0, 1.0], [0, 1], 2)
+
+    Notes:
+        - Changing the weight of an existing value in place is not detected;
+          rebuild the entry (``cache.pop(axis)``) after doing so
+    """
+    values = axes.get(axis)
+    if values is None:
+        return None
+    table = cache.get(axis)
+    if table is None or table[0] is not values or table[3] != len(values):
+        prob, alias = build_alias_table(values, weights.get(axis))
+        table = cache[axis] = (values, prob, alias, len(values))
+    return table
+
+
+def alias_choice(
+    options: list[str],
+    prob: list[float],
+    alias: list[int],
+    rng: random.Random | None = None,
+) -> str:
+    """Select a random option from a precomputed alias table.
+
+    Args:
+        options: List of possible values the table was built from.
+        prob: Bucket keep-probabilities from :func:`build_alias_table`.
+        alias: Bucket aliases from :func:`build_alias_table`.
+        rng: Optional Random instance for isolated random generation.
+            If None, uses global random module.
+
+    Returns:
+        Randomly selected option (str)
+
+    Examples:
+        >>> prob, alias = build_alias_table(["rare", "common"], {"rare": 1.0, "common": 3.0})
+        >>> alias_choice(["rare", "common"], prob, alias, rng=random.Random(42))
+        'common'
+
+    Notes:
+        - A single random() draw picks the bucket (integer part) and flips
+          the bucket's coin (fractional part)
+        - Produces the same distribution as weighted_choice, but not the
+          same sequence of values for a given seed
+    """
+    scaled = (random.random() if rng is None else rng.random()) * len(options)
+    index = int(scaled)
+    if scaled - index < prob[index]:
+        return options[index]
+    return options[alias[index]]
+
+
 def apply_exclusion_rules(
     chosen: dict[str, str],
     exclusions: dict[tuple[str, str], dict[str, list[str]]],
@@ -128,7 +279,8 @@ def apply_exclusion_rules(
     for (axis, value), blocked in exclusions.items():
         # Check if this exclusion rule is triggered
         if chosen.get(axis) == value:
-            logger.debug(f"Exclusion rule triggered: {axis}={value}")
+            # Lazy %-formatting: nothing is formatted unless DEBUG is enabled
+            logger.debug("Exclusion rule triggered: %s=%s", axis, value)
 
             # Check each blocked axis
             for blocked_axis, blocked_values in blocked.items():
@@ -136,17 +288,120 @@ def apply_exclusion_rules(
                     removed_value = chosen.pop(blocked_axis)
                     exclusions_applied += 1
                     logger.debug(
-                        f"  Removed {blocked_axis}={removed_value} "
-                        f"(conflicts with {axis}={value})"
+                        "  Removed %s=%s (conflicts with %s=%s)",
+                        blocked_axis,
+                        removed_value,
+                        axis,
+                        value,
                     )
 
     if exclusions_applied > 0:
-        logger.info(f"Applied {exclusions_applied} exclusion rule(s)")
+        logger.info("Applied %d exclusion rule(s)", exclusions_applied)
+
+    return chosen
+
+
+def compile_exclusion_rules(
+    exclusions: dict[tuple[str, str], dict[str, list[str]]],
+) -> dict[tuple[str, str], tuple[int, str, str, tuple[tuple[str, frozenset[str]], ...]]]:
+    """Precompile exclusion rules into a lookup index keyed by trigger.
+
+    apply_exclusion_rules() walks every rule for every generated entity, even
+    though only rules whose (axis, value) trigger was actually chosen can
+    fire. Compiling the rules once lets generators look up just the rules
+    their chosen values trigger, with blocked values held in frozensets.
+
+    Args:
+        exclusions: Dictionary of exclusion rules.
+                   Format: {(axis, value): {blocked_axis: [blocked_values]}}
+
+    Returns:
+        Dictionary mapping each trigger (axis, value) to a tuple of
+        ``(rule_order, axis, value, ((blocked_axis, frozenset(values)), ...))``.
+        rule_order is the rule's position in ``exclusions`` and is used to
+        apply triggered rules in their original order.
+
+    Example:
+        >>> compile_exclusion_rules({("wealth", "decadent"): {"health": ["sickly"]}})
+        {('wealth', 'decadent'): (0, 'wealth', 'decadent', (('health', frozenset({'sickly'})),))}
+    """
+    return {
+        (axis, value): (
+            order,
+            axis,
+            value,
+            tuple(
+                (blocked_axis, frozenset(blocked_values))
+                for blocked_axis, blocked_values in blocked.items()
+            ),
+        )
+        for order, ((axis, value), blocked) in enumerate(exclusions.items())
+    }
+
+
+def apply_compiled_exclusions(
+    chosen: dict[str, str],
+    compiled: dict[tuple[str, str], tuple[int, str, str, tuple[tuple[str, frozenset[str]], ...]]],
+) -> dict[str, str]:
+    """Apply exclusion rules precompiled by :func:`compile_exclusion_rules`.
+
+    Produces exactly the same result as :func:`apply_exclusion_rules` on the
+    original rules, but only visits rules triggered by the chosen values.
+
+    Args:
+        chosen: Dictionary mapping axis names to selected values.
+               Modified in-place as exclusions are applied.
+        compiled: Index returned by compile_exclusion_rules().
+
+    Returns:
+        The modified chosen dictionary (same reference, for convenience)
+
+    Example:
+        >>> compiled = compile_exclusion_rules({("wealth", "decadent"): {"health": ["sickly"]}})
+        >>> apply_compiled_exclusions({"wealth": "decadent", "health": "sickly"}, compiled)
+        {'wealth': 'decadent'}
+
+    Notes:
+        - Triggered rules run in their original order, and a rule whose
+          trigger was removed by an earlier rule is skipped, matching the
+          sequential scan in apply_exclusion_rules()
+    """
+    triggered = [compiled[item] for item in chosen.items() if item in compiled]
+    if not triggered:
+        return chosen
+    triggered.sort()
+
+    exclusions_applied = 0
+
+    for _, axis, value, blocked in triggered:
+        # An earlier rule may have removed this trigger
+        if chosen.get(axis) != value:
+            continue
+        logger.debug("Exclusion rule triggered: %s=%s", axis, value)
+
+        for blocked_axis, blocked_values in blocked:
+            if chosen.get(blocked_axis) in blocked_values:
+                removed_value = chosen.pop(blocked_axis)
+                exclusions_applied += 1
+                logger.debug(
+                    "  Removed %s=%s (conflicts with %s=%s)",
+                    blocked_axis,
+                    removed_value,
+                    axis,
+                    value,
+                )
+
+    if exclusions_applied > 0:
+        logger.info("Applied %d exclusion rule(s)", exclusions_applied)
 
     return chosen
 
 
-def values_to_prompt(condition_dict: dict[str, str]) -> str:
+# Bound once so each prompt conversion skips the str.join attribute lookup
+_join_prompt = ", ".join
+
+
+def values_to_prompt(condition_dict: Mapping[str, str]) -> str:
     """Convert structured condition data to a comma-separated prompt fragment.
 
     This is the canonical serialization format for condition axis data.
@@ -179,15 +434,18 @@ def values_to_prompt(condition_dict: dict[str, str]) -> str:
         - Maintains insertion order from generation
         - Can be extended for different output formats (JSON, prose, etc.)
     """
-    if not condition_dict:
-        return ""
-
-    # Join values with comma separator (diffusion-friendly format)
-    return ", ".join(condition_dict.values())
+    # Join values with comma separator (diffusion-friendly format); an empty
+    # dict joins to "" without a separate check
+    return _join_prompt(condition_dict.values())
 
 
 __all__ = [
+    "alias_choice",
+    "apply_compiled_exclusions",
     "apply_exclusion_rules",
+    "build_alias_table",
+    "cached_alias_table",
+    "compile_exclusion_rules",
     "values_to_prompt",
     "weighted_choice",
 ]
@@ -33,9 +33,18 @@ Architecture:
 
 import logging
 import random
-from typing import Any
-
-from ._base import apply_exclusion_rules, values_to_prompt, weighted_choice
+from array import array
+from collections.abc import Callable, Mapping
+from typing import Any, Literal, overload
+
+from ._base import (
+    alias_choice,
+    apply_compiled_exclusions,
+    build_alias_table,
+    cached_alias_table,
+    compile_exclusion_rules,
+    values_to_prompt,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -155,19 +164,80 @@ EXCLUSIONS: dict[tuple[str, str], dict[str, list[str]]] = {
     },
 }
 
+# ============================================================================
+# PRECOMPUTED TABLES - Built Once at Import
+# ============================================================================
+
+# One Vose alias table per axis as (values, prob, alias, size), built at
+# import so each draw in generate_condition() is O(1) instead of rebuilding
+# cumulative weights. Unweighted axes get a uniform table. Read entries via
+# cached_alias_table(), which rebuilds them if CONDITION_AXES is extended.
+_DRAW_TABLES: dict[str, tuple[list[str], list[float], list[int], int]] = {
+    axis: (values, *build_alias_table(values, WEIGHTS.get(axis)), len(values))
+    for axis, values in CONDITION_AXES.items()
+}
+
+# EXCLUSIONS indexed by trigger, so each generation only visits the rules its
+# chosen values actually trigger instead of scanning every rule.
+_EXCLUSION_INDEX = compile_exclusion_rules(EXCLUSIONS)
+
+# AXIS_POLICY membership as frozensets, for cheap set algebra against a
+# condition's keys() view (e.g. ``condition.keys() & MANDATORY_SET``).
+MANDATORY_SET: frozenset[str] = frozenset(AXIS_POLICY["mandatory"])
+OPTIONAL_SET: frozenset[str] = frozenset(AXIS_POLICY["optional"])
+
+# Integer codes for axis values, used by generate_conditions_range(). A code
+# is the value's position in CONDITION_AXES[axis]; AXIS_VALUES decodes it and
+# AXIS_VALUE_INDEX encodes a value back to its code.
+AXIS_VALUES: dict[str, tuple[str, ...]] = {
+    axis: tuple(values) for axis, values in CONDITION_AXES.items()
+}
+AXIS_VALUE_INDEX: dict[str, dict[str, int]] = {
+    axis: {value: code for code, value in enumerate(values)}
+    for axis, values in CONDITION_AXES.items()
+}
+
 
 # ============================================================================
 # GENERATOR FUNCTIONS
 # ============================================================================
 
 
+def sample_axis(axis: str, rng: random.Random | None = None) -> str:
+    """Draw a single weighted value for one character axis.
+
+    Uses the alias table precomputed for the axis at import time, so the
+    distribution matches WEIGHTS without per-call weight processing.
+
+    Args:
+        axis: Name of the axis (e.g., 'physique', 'wealth')
+        rng: Optional Random instance for isolated random generation.
+            If None, uses global random module.
+
+    Returns:
+        Randomly selected value for that axis
+
+    Raises:
+        KeyError: If axis is not defined in CONDITION_AXES
+
+    Example:
+        >>> sample_axis("wealth", random.Random(42))
+        'wealthy'
+    """
+    table = cached_alias_table(_DRAW_TABLES, CONDITION_AXES, WEIGHTS, axis)
+    if table is None:
+        raise KeyError(axis)
+    values, prob, alias, _ = table
+    return alias_choice(values, prob, alias, rng=rng)
+
+
 def generate_condition(seed: int | None = None) -> dict[str, str]:
     """Generate a coherent character condition using weighted random selection.
 
     This function applies the full rule system:
     1. Select mandatory axes (always included)
     2. Select 0-N optional axes (controlled by policy)
-    3. Apply weighted probability distributions
+    3. Apply weighted probability distributions (via precomputed alias tables)
     4. Apply semantic exclusion rules
     5. Return structured condition data
 
@@ -191,51 +261,220 @@ def generate_condition(seed: int | None = None) -> dict[str, str]:
         {'physique': 'stocky', 'wealth': 'modest', 'health': 'weary'}
     """
     # Create isolated RNG instance to avoid polluting global random state
+    return generate_condition_with_rng(random.Random(seed))
+
+
+def generate_conditions_batch(n: int, seed: int | None = None) -> dict[str, list[str | None]]:
+    """Generate many character conditions from a single random stream.
+
+    Looping ``generate_condition(seed=i)`` builds a fresh RNG and a result
+    dict per character. This function seeds one RNG for the whole batch and
+    returns the results column-wise (one list per axis), which is the layout
+    aggregation code usually wants anyway.
+
+    Args:
+        n: Number of characters to generate.
+        seed: Optional random seed for the whole batch.
+             If None, uses system entropy (non-reproducible).
+
+    Returns:
+        Dictionary mapping every axis in CONDITION_AXES to a list of length n.
+        Row i holds character i's value, or None if that axis is absent
+        (optional axis not selected, or removed by an exclusion rule).
+
+    Examples:
+        >>> batch = generate_conditions_batch(3, seed=42)
+        >>> len(batch["wealth"])
+        3
+        >>> batch == generate_conditions_batch(3, seed=42)
+        True
+
+    Notes:
+        - Same rules and distribution as generate_condition()
+        - Row i is NOT the same as generate_condition(seed=i); the batch is
+          reproducible only as a whole for a given (n, seed)
+        - Rows are drawn in order from one stream, so a batch is a prefix of
+          any larger batch with the same seed
+    """
     rng = random.Random(seed)
+    columns: dict[str, list[str | None]] = {axis: [None] * n for axis in CONDITION_AXES}
+
+    for row in range(n):
+        for axis, value in _draw_condition(rng).items():
+            columns[axis][row] = value
+
+    return columns
+
+
+@overload
+def generate_conditions_range(
+    start: int, stop: int, decode: Literal[False] = ...
+) -> dict[str, array[int]]: ...
+
 
+@overload
+def generate_conditions_range(
+    start: int, stop: int, decode: Literal[True]
+) -> dict[str, list[str | None]]: ...
+
+
+def generate_conditions_range(
+    start: int, stop: int, decode: bool = False
+) -> dict[str, array[int]] | dict[str, list[str | None]]:
+    """Generate the characters for a range of seeds as column-wise data.
+
+    Row i holds exactly what generate_condition(seed=start + i) returns. By
+    default each value is encoded as its index in CONDITION_AXES[axis] (see
+    AXIS_VALUES) and stored in one compact int array per axis, so code that
+    only counts or filters a column never touches strings; decode values
+    once when reporting, not per row.
+
+    Args:
+        start: First seed (inclusive).
+        stop: Last seed (exclusive).
+        decode: If True, return value strings (None = absent) instead of
+            integer codes.
+
+    Returns:
+        Dictionary mapping every axis in CONDITION_AXES to a column of length
+        ``stop - start`` (empty if stop <= start). Columns are ``array('i')``
+        with -1 for absent axes, or lists of str/None when decode=True.
+
+    Examples:
+        >>> columns = generate_conditions_range(0, 3)
+        >>> code = columns["wealth"][0]
+        >>> AXIS_VALUES["wealth"][code] == generate_condition(seed=0)["wealth"]
+        True
+        >>> poor_count = columns["wealth"].count(AXIS_VALUE_INDEX["wealth"]["poor"])
+
+        >>> generate_conditions_range(0, 3, decode=True)["wealth"][0] == (
+        ...     generate_condition(seed=0)["wealth"]
+        ... )
+        True
+
+    Notes:
+        - One Random instance is reseeded per row rather than allocated
+        - Integer codes come from AXIS_VALUE_INDEX, built at import; use
+          decode=True for values added to CONDITION_AXES afterwards
+    """
+    n = max(stop - start, 0)
+    rng = random.Random()
+
+    if decode:
+        values: dict[str, list[str | None]] = {axis: [None] * n for axis in CONDITION_AXES}
+        for row, seed in enumerate(range(start, stop)):
+            rng.seed(seed)
+            for axis, value in _draw_condition(rng).items():
+                values[axis][row] = value
+        return values
+
+    codes = {axis: array("i", [-1]) * n for axis in CONDITION_AXES}
+    for row, seed in enumerate(range(start, stop)):
+        rng.seed(seed)
+        for axis, value in _draw_condition(rng).items():
+            codes[axis][row] = AXIS_VALUE_INDEX[axis][value]
+    return codes
+
+
+def _draw_axis(
+    table: tuple[list[str], list[float], list[int], int], rand: Callable[[], float]
+) -> str:
+    """Draw one value from a _DRAW_TABLES entry (inlined alias_choice()).
+
+    Args:
+        table: The axis's (values, prob, alias, size) entry in _DRAW_TABLES.
+        rand: Bound ``random()`` method of the generator to draw from.
+
+    Returns:
+        Randomly selected value for the axis.
+    """
+    values, prob, alias, size = table
+    scaled = rand() * size
+    index = int(scaled)
+    return values[index] if scaled - index < prob[index] else values[alias[index]]
+
+
+def _draw_condition(rng: random.Random) -> dict[str, str]:
+    """Draw one character condition.
+
+    This is the single generator body: generate_condition_with_rng() and the
+    batch/range generators all call it, so every path consumes the stream
+    the same way and the RNG may be reseeded between calls. Per-axis debug
+    records are only built when DEBUG logging is enabled.
+
+    Args:
+        rng: Random instance to draw from (advanced in place).
+
+    Returns:
+        Dictionary mapping axis names to selected values.
+    """
     chosen: dict[str, str] = {}
+    rand = rng.random
+    debug = logger.isEnabledFor(logging.DEBUG)
 
     # ========================================================================
     # PHASE 1: Select mandatory axes
     # These establish the baseline character state
     # ========================================================================
     for axis in AXIS_POLICY["mandatory"]:
-        if axis not in CONDITION_AXES:
+        table = cached_alias_table(_DRAW_TABLES, CONDITION_AXES, WEIGHTS, axis)
+        if table is None:
             logger.warning(f"Mandatory axis '{axis}' not defined in CONDITION_AXES")
             continue
-
-        chosen[axis] = weighted_choice(CONDITION_AXES[axis], WEIGHTS.get(axis), rng=rng)
-        logger.debug(f"Mandatory axis selected: {axis} = {chosen[axis]}")
+        chosen[axis] = _draw_axis(table, rand)
+        if debug:
+            logger.debug("Mandatory axis selected: %s = %s", axis, chosen[axis])
 
     # ========================================================================
     # PHASE 2: Select optional axes
     # Randomly pick 0 to max_optional axes to add narrative detail
     # ========================================================================
-    max_optional = AXIS_POLICY.get("max_optional", 2)
-    num_optional = rng.randint(0, min(max_optional, len(AXIS_POLICY["optional"])))
-
-    # Randomly sample without replacement
-    optional_axes = rng.sample(AXIS_POLICY["optional"], num_optional)
-    logger.debug(f"Selected {num_optional} optional axes: {optional_axes}")
+    optional = AXIS_POLICY["optional"]
+    num_optional = rng.randint(0, min(AXIS_POLICY.get("max_optional", 2), len(optional)))
+    optional_axes = rng.sample(optional, num_optional)
+    if debug:
+        logger.debug("Selected %d optional axes: %s", num_optional, optional_axes)
 
     for axis in optional_axes:
-        if axis not in CONDITION_AXES:
+        table = cached_alias_table(_DRAW_TABLES, CONDITION_AXES, WEIGHTS, axis)
+        if table is None:
             logger.warning(f"Optional axis '{axis}' not defined in CONDITION_AXES")
             continue
-
-        chosen[axis] = weighted_choice(CONDITION_AXES[axis], WEIGHTS.get(axis), rng=rng)
-        logger.debug(f"Optional axis selected: {axis} = {chosen[axis]}")
+        chosen[axis] = _draw_axis(table, rand)
+        if debug:
+            logger.debug("Optional axis selected: %s = %s", axis, chosen[axis])
 
     # ========================================================================
     # PHASE 3: Apply semantic exclusion rules
     # Remove illogical combinations (e.g., decadent + frail)
     # ========================================================================
-    apply_exclusion_rules(chosen, EXCLUSIONS)
+    return apply_compiled_exclusions(chosen, _EXCLUSION_INDEX)
+
 
-    return chosen
+def generate_condition_with_rng(rng: random.Random) -> dict[str, str]:
+    """Generate a character condition from an existing Random instance.
+
+    generate_condition(seed) is this function applied to a fresh
+    ``random.Random(seed)``. Callers sweeping many seeds can instead keep one
+    instance and reseed it, which gives identical results without allocating
+    a new generator per character.
+
+    Args:
+        rng: Random instance to draw from (advanced in place).
+
+    Returns:
+        Dictionary mapping axis names to selected values.
+
+    Examples:
+        >>> rng = random.Random()
+        >>> rng.seed(42)
+        >>> generate_condition_with_rng(rng) == generate_condition(seed=42)
+        True
+    """
+    return _draw_condition(rng)
 
 
-def condition_to_prompt(condition_dict: dict[str, str]) -> str:
+def condition_to_prompt(condition_dict: Mapping[str, str]) -> str:
     """Convert structured condition data to a comma-separated prompt fragment.
 
     This is the only place structured data becomes prose text.
@@ -301,11 +540,19 @@ def get_axis_values(axis: str) -> list[str]:
 
 __all__ = [
     "AXIS_POLICY",
+    "AXIS_VALUES",
+    "AXIS_VALUE_INDEX",
     "CONDITION_AXES",
     "EXCLUSIONS",
+    "MANDATORY_SET",
+    "OPTIONAL_SET",
     "WEIGHTS",
     "condition_to_prompt",
     "generate_condition",
+    "generate_condition_with_rng",
+    "generate_conditions_batch",
+    "generate_conditions_range",
     "get_available_axes",
     "get_axis_values",
+    "sample_axis",
 ]
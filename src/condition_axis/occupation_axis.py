@@ -44,9 +44,17 @@ Future Integration:
 
 import logging
 import random
+from collections.abc import Mapping
 from typing import Any
 
-from ._base import apply_exclusion_rules, values_to_prompt, weighted_choice
+from ._base import (
+    alias_choice,
+    apply_compiled_exclusions,
+    build_alias_table,
+    cached_alias_table,
+    compile_exclusion_rules,
+    values_to_prompt,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -193,6 +201,24 @@ OCCUPATION_EXCLUSIONS: dict[tuple[str, str], dict[str, list[str]]] = {
 }
 
 
+# ============================================================================
+# PRECOMPUTED TABLES - Built Once at Import
+# ============================================================================
+
+# One Vose alias table per axis as (values, prob, alias, size), so each draw
+# in generate_occupation_condition() is O(1) with no per-call weight
+# processing. Read entries via cached_alias_table(), which rebuilds them if
+# OCCUPATION_AXES is extended.
+_OCCUPATION_DRAW_TABLES: dict[str, tuple[list[str], list[float], list[int], int]] = {
+    axis: (values, *build_alias_table(values, OCCUPATION_WEIGHTS.get(axis)), len(values))
+    for axis, values in OCCUPATION_AXES.items()
+}
+
+# OCCUPATION_EXCLUSIONS indexed by trigger, so each generation only visits
+# the rules its chosen values actually trigger.
+_OCCUPATION_EXCLUSION_INDEX = compile_exclusion_rules(OCCUPATION_EXCLUSIONS)
+
+
 # ============================================================================
 # GENERATOR FUNCTIONS
 # ============================================================================
@@ -232,21 +258,49 @@ def generate_occupation_condition(seed: int | None = None) -> dict[str, str]:
         {'legitimacy': 'tolerated', 'visibility': 'discreet'}
     """
     # Create isolated RNG instance to avoid polluting global random state
-    rng = random.Random(seed)
+    return generate_occupation_condition_with_rng(random.Random(seed))
+
+
+def generate_occupation_condition_with_rng(rng: random.Random) -> dict[str, str]:
+    """Generate an occupation condition from an existing Random instance.
 
+    generate_occupation_condition(seed) is this function applied to a fresh
+    ``random.Random(seed)``. Callers sweeping many seeds can instead keep one
+    instance and reseed it, which gives identical results without allocating
+    a new generator per occupation.
+
+    Args:
+        rng: Random instance to draw from (advanced in place).
+
+    Returns:
+        Dictionary mapping axis names to selected values.
+
+    Examples:
+        >>> rng = random.Random()
+        >>> rng.seed(42)
+        >>> generate_occupation_condition_with_rng(rng) == generate_occupation_condition(seed=42)
+        True
+    """
     chosen: dict[str, str] = {}
+    # Per-axis debug records are only built when DEBUG logging is enabled
+    debug = logger.isEnabledFor(logging.DEBUG)
 
     # ========================================================================
     # PHASE 1: Select mandatory axes
     # These establish the baseline occupation profile
     # ========================================================================
     for axis in OCCUPATION_POLICY["mandatory"]:
-        if axis not in OCCUPATION_AXES:
+        table = cached_alias_table(
+            _OCCUPATION_DRAW_TABLES, OCCUPATION_AXES, OCCUPATION_WEIGHTS, axis
+        )
+        if table is None:
             logger.warning(f"Mandatory axis '{axis}' not defined in OCCUPATION_AXES")
             continue
 
-        chosen[axis] = weighted_choice(OCCUPATION_AXES[axis], OCCUPATION_WEIGHTS.get(axis), rng=rng)
-        logger.debug(f"Mandatory axis selected: {axis} = {chosen[axis]}")
+        values, prob, alias, _ = table
+        chosen[axis] = alias_choice(values, prob, alias, rng=rng)
+        if debug:
+            logger.debug("Mandatory axis selected: %s = %s", axis, chosen[axis])
 
     # ========================================================================
     # PHASE 2: Select optional axes
@@ -257,26 +311,32 @@ def generate_occupation_condition(seed: int | None = None) -> dict[str, str]:
 
     # Randomly sample without replacement
     optional_axes = rng.sample(OCCUPATION_POLICY["optional"], num_optional)
-    logger.debug(f"Selected {num_optional} optional axes: {optional_axes}")
+    if debug:
+        logger.debug("Selected %d optional axes: %s", num_optional, optional_axes)
 
     for axis in optional_axes:
-        if axis not in OCCUPATION_AXES:
+        table = cached_alias_table(
+            _OCCUPATION_DRAW_TABLES, OCCUPATION_AXES, OCCUPATION_WEIGHTS, axis
+        )
+        if table is None:
             logger.warning(f"Optional axis '{axis}' not defined in OCCUPATION_AXES")
             continue
 
-        chosen[axis] = weighted_choice(OCCUPATION_AXES[axis], OCCUPATION_WEIGHTS.get(axis), rng=rng)
-        logger.debug(f"Optional axis selected: {axis} = {chosen[axis]}")
+        values, prob, alias, _ = table
+        chosen[axis] = alias_choice(values, prob, alias, rng=rng)
+        if debug:
+            logger.debug("Optional axis selected: %s = %s", axis, chosen[axis])
 
     # ========================================================================
     # PHASE 3: Apply semantic exclusion rules
     # Remove illogical combinations (e.g., illicit + conspicuous)
     # ========================================================================
-    apply_exclusion_rules(chosen, OCCUPATION_EXCLUSIONS)
+    apply_compiled_exclusions(chosen, _OCCUPATION_EXCLUSION_INDEX)
 
     return chosen
 
 
-def occupation_condition_to_prompt(condition_dict: dict[str, str]) -> str:
+def occupation_condition_to_prompt(condition_dict: Mapping[str, str]) -> str:
     """Convert structured occupation condition data to a prompt fragment.
 
     This is the canonical serialization format for occupation axis data.
@@ -356,6 +416,7 @@ __all__ = [
     "OCCUPATION_POLICY",
     "OCCUPATION_WEIGHTS",
     "generate_occupation_condition",
+    "generate_occupation_condition_with_rng",
     "get_available_occupation_axes",
     "get_occupation_axis_values",
     "occupation_condition_to_prompt",
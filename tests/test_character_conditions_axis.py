@@ -12,21 +12,66 @@ Test coverage includes:
 - Helper functions
 """
 
+import logging
 import random
 
 import pytest
 
 from condition_axis import (
     AXIS_POLICY,
+    AXIS_VALUE_INDEX,
+    AXIS_VALUES,
     CONDITION_AXES,
     EXCLUSIONS,
+    MANDATORY_SET,
+    OPTIONAL_SET,
     WEIGHTS,
     condition_to_prompt,
     generate_condition,
+    generate_condition_with_rng,
+    generate_conditions_batch,
+    generate_conditions_range,
     get_available_axes,
     get_axis_values,
+    sample_axis,
+)
+from condition_axis._base import (
+    alias_choice,
+    apply_compiled_exclusions,
+    apply_exclusion_rules,
+    build_alias_table,
+    compile_exclusion_rules,
+    weighted_choice,
 )
-from condition_axis._base import weighted_choice
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture(scope="module")
+def seeded_columns() -> dict[str, list[str | None]]:
+    """Characters for seeds 0-1999 as one decoded column per axis.
+
+    Row i equals generate_condition(seed=i), so the statistical tests share a
+    single generation pass instead of each regenerating the same seeds.
+
+    Returns:
+        Dictionary mapping every axis to its column (None = absent).
+    """
+    return generate_conditions_range(0, 2000, decode=True)
+
+
+def _seeds_with(
+    columns: dict[str, list[str | None]], axis: str, value: str, other_axis: str, other_value: str
+) -> list[int]:
+    """Return the seeds whose row has axis=value together with other_axis=other_value."""
+    return [
+        seed
+        for seed, (first, second) in enumerate(zip(columns[axis], columns[other_axis], strict=True))
+        if first == value and second == other_value
+    ]
+
 
 # ============================================================================
 # Test Data Structures
@@ -89,6 +134,13 @@ class TestDataStructures:
         for axis in all_policy_axes:
             assert axis in CONDITION_AXES, f"Axis '{axis}' in policy but not in CONDITION_AXES"
 
+    def test_policy_sets_match_axis_policy(self):
+        """Test MANDATORY_SET/OPTIONAL_SET mirror AXIS_POLICY."""
+        assert isinstance(MANDATORY_SET, frozenset)
+        assert isinstance(OPTIONAL_SET, frozenset)
+        assert MANDATORY_SET == set(AXIS_POLICY["mandatory"])
+        assert OPTIONAL_SET == set(AXIS_POLICY["optional"])
+
     def test_no_overlap_mandatory_optional(self):
         """Test that mandatory and optional axes don't overlap."""
         mandatory_set = set(AXIS_POLICY["mandatory"])
@@ -196,6 +248,132 @@ class TestWeightedChoice:
         assert result1 == result2
 
 
+# ============================================================================
+# Test Alias Table Sampling
+# ============================================================================
+
+
+class TestAliasSampling:
+    """Test precomputed alias table construction and sampling."""
+
+    def test_build_alias_table_uniform(self):
+        """Test that unweighted options produce full, self-aliased buckets."""
+        prob, alias = build_alias_table(["a", "b", "c"])
+
+        assert prob == [1.0, 1.0, 1.0]
+        assert alias == [0, 1, 2]
+
+    def test_build_alias_table_preserves_distribution(self):
+        """Test that bucket masses add back up to the normalized weights."""
+        options = ["poor", "modest", "wealthy"]
+        weights = {"poor": 4.0, "modest": 3.0, "wealthy": 1.0}
+        prob, alias = build_alias_table(options, weights)
+
+        n = len(options)
+        mass = [0.0] * n
+        for i in range(n):
+            mass[i] += prob[i] / n
+            mass[alias[i]] += (1.0 - prob[i]) / n
+
+        total = sum(weights.values())
+        for i, option in enumerate(options):
+            assert mass[i] == pytest.approx(weights[option] / total)
+
+    def test_build_alias_table_rejects_empty(self):
+        """Test that an empty option list is rejected."""
+        with pytest.raises(ValueError):
+            build_alias_table([])
+
+    def test_alias_choice_zero_weight_never_selected(self):
+        """Test that zero-weight options are never drawn."""
+        options = ["never", "always"]
+        prob, alias = build_alias_table(options, {"never": 0.0})
+        rng = random.Random(42)
+
+        results = {alias_choice(options, prob, alias, rng=rng) for _ in range(500)}
+        assert results == {"always"}
+
+    def test_sample_axis_deterministic_with_rng(self):
+        """Test that sample_axis is reproducible with a seeded Random."""
+        result1 = sample_axis("wealth", random.Random(42))
+        result2 = sample_axis("wealth", random.Random(42))
+
+        assert result1 == result2
+        assert result1 in CONDITION_AXES["wealth"]
+
+    def test_sample_axis_invalid_axis(self):
+        """Test that sample_axis raises KeyError for an unknown axis."""
+        with pytest.raises(KeyError):
+            sample_axis("nonexistent_axis")
+
+    def test_extended_axis_values_are_sampled(self, monkeypatch):
+        """Test that values appended to CONDITION_AXES after import are drawn."""
+        monkeypatch.setitem(WEIGHTS, "wealth", {**WEIGHTS["wealth"], "bankrupt": 1000.0})
+        CONDITION_AXES["wealth"].append("bankrupt")
+        try:
+            rng = random.Random(42)
+            samples = {sample_axis("wealth", rng) for _ in range(200)}
+            generated = {generate_condition(seed=seed)["wealth"] for seed in range(50)}
+        finally:
+            CONDITION_AXES["wealth"].pop()
+
+        assert "bankrupt" in samples
+        assert "bankrupt" in generated
+        assert "bankrupt" not in {generate_condition(seed=seed)["wealth"] for seed in range(50)}
+
+    def test_added_axis_is_sampled(self, monkeypatch):
+        """Test that an axis added to CONDITION_AXES after import can be sampled."""
+        monkeypatch.setitem(CONDITION_AXES, "posture", ["upright", "slouched"])
+
+        assert sample_axis("posture", random.Random(42)) in {"upright", "slouched"}
+
+
+# ============================================================================
+# Test Compiled Exclusions
+# ============================================================================
+
+
+class TestCompiledExclusions:
+    """Test that the indexed exclusion path matches the rule scan."""
+
+    def test_compiled_matches_scan_for_all_pairs(self):
+        """Test every combination of two axis values against both paths."""
+        compiled = compile_exclusion_rules(EXCLUSIONS)
+        axes = list(CONDITION_AXES)
+
+        for i, axis_a in enumerate(axes):
+            for axis_b in axes[i + 1 :]:
+                for value_a in CONDITION_AXES[axis_a]:
+                    for value_b in CONDITION_AXES[axis_b]:
+                        chosen = {axis_a: value_a, axis_b: value_b}
+                        expected = apply_exclusion_rules(dict(chosen), EXCLUSIONS)
+                        assert apply_compiled_exclusions(dict(chosen), compiled) == expected
+
+    def test_compiled_respects_rule_order(self):
+        """Test that a trigger removed by an earlier rule no longer fires."""
+        exclusions = {
+            ("wealth", "decadent"): {"health": ["sickly"]},
+            ("health", "sickly"): {"facial_signal": ["soft-featured"]},
+        }
+        chosen = {"wealth": "decadent", "health": "sickly", "facial_signal": "soft-featured"}
+
+        expected = apply_exclusion_rules(dict(chosen), exclusions)
+        result = apply_compiled_exclusions(dict(chosen), compile_exclusion_rules(exclusions))
+
+        assert result == expected
+        assert result == {"wealth": "decadent", "facial_signal": "soft-featured"}
+
+    def test_compiled_matches_scan_on_random_conditions(self):
+        """Test full random conditions against both paths."""
+        compiled = compile_exclusion_rules(EXCLUSIONS)
+        rng = random.Random(42)
+
+        for _ in range(500):
+            chosen = {axis: rng.choice(values) for axis, values in CONDITION_AXES.items()}
+            expected = apply_exclusion_rules(dict(chosen), EXCLUSIONS)
+            assert apply_compiled_exclusions(dict(chosen), compiled) == expected
+
+
 # ============================================================================
 # Test generate_condition Function
 # ============================================================================
@@ -285,6 +463,24 @@ class TestGenerateCondition:
         assert isinstance(result, dict)
         assert len(result) > 0
 
+    def test_generate_condition_with_reseeded_rng_matches_seed(self):
+        """Test that reseeding one Random reproduces generate_condition(seed=k)."""
+        rng = random.Random()
+
+        for seed in range(50):
+            rng.seed(seed)
+            assert generate_condition_with_rng(rng) == generate_condition(seed=seed)
+
+    def test_generate_condition_same_with_debug_logging(self, caplog):
+        """Test that enabling DEBUG logging does not change generated conditions."""
+        fast = [generate_condition(seed=seed) for seed in range(200)]
+
+        with caplog.at_level(logging.DEBUG, logger="condition_axis.character_conditions"):
+            logged = [generate_condition(seed=seed) for seed in range(200)]
+
+        assert logged == fast
+        assert any("Mandatory axis selected" in message for message in caplog.messages)
+
     def test_generate_condition_weighted_distribution(self):
         """Test that weights affect probability distribution (statistical test)."""
         # Focus on wealth axis which has strong weights
@@ -305,71 +501,152 @@ class TestGenerateCondition:
             if "poor" in wealth_counts and "decadent" in wealth_counts:
                 assert wealth_counts["poor"] > wealth_counts["decadent"]
 
-    def test_young_excludes_weathered(self):
+    def test_young_excludes_weathered(self, seeded_columns):
         """Test that young age excludes weathered facial signal."""
-        violations = []
-
-        for seed in range(500):
-            condition = generate_condition(seed=seed)
-            if condition.get("age") == "young" and condition.get("facial_signal") == "weathered":
-                violations.append(seed)
+        violations = _seeds_with(seeded_columns, "age", "young", "facial_signal", "weathered")
 
         assert len(violations) == 0, f"Young + weathered found at seeds: {violations}"
 
-    def test_ancient_excludes_understated(self):
+    def test_ancient_excludes_understated(self, seeded_columns):
         """Test that ancient age excludes understated facial signal."""
-        violations = []
-
-        for seed in range(500):
-            condition = generate_condition(seed=seed)
-            if (
-                condition.get("age") == "ancient"
-                and condition.get("facial_signal") == "understated"
-            ):
-                violations.append(seed)
+        violations = _seeds_with(seeded_columns, "age", "ancient", "facial_signal", "understated")
 
         assert len(violations) == 0, f"Ancient + understated found at seeds: {violations}"
 
-    def test_hale_excludes_weathered(self):
+    def test_hale_excludes_weathered(self, seeded_columns):
         """Test that hale health excludes weathered facial signal."""
-        violations = []
-
-        for seed in range(500):
-            condition = generate_condition(seed=seed)
-            if condition.get("health") == "hale" and condition.get("facial_signal") == "weathered":
-                violations.append(seed)
+        violations = _seeds_with(seeded_columns, "health", "hale", "facial_signal", "weathered")
 
         assert len(violations) == 0, f"Hale + weathered found at seeds: {violations}"
 
-    def test_sickly_excludes_soft_featured(self):
+    def test_sickly_excludes_soft_featured(self, seeded_columns):
         """Test that sickly health excludes soft-featured facial signal."""
-        violations = []
-
-        for seed in range(500):
-            condition = generate_condition(seed=seed)
-            if (
-                condition.get("health") == "sickly"
-                and condition.get("facial_signal") == "soft-featured"
-            ):
-                violations.append(seed)
+        violations = _seeds_with(
+            seeded_columns, "health", "sickly", "facial_signal", "soft-featured"
+        )
 
         assert len(violations) == 0, f"Sickly + soft-featured found at seeds: {violations}"
 
-    def test_decadent_excludes_weathered(self):
+    def test_decadent_excludes_weathered(self, seeded_columns):
         """Test that decadent wealth excludes weathered facial signal."""
-        violations = []
-
-        for seed in range(500):
-            condition = generate_condition(seed=seed)
-            if (
-                condition.get("wealth") == "decadent"
-                and condition.get("facial_signal") == "weathered"
-            ):
-                violations.append(seed)
+        violations = _seeds_with(seeded_columns, "wealth", "decadent", "facial_signal", "weathered")
 
         assert len(violations) == 0, f"Decadent + weathered found at seeds: {violations}"
 
 
+# ============================================================================
+# Test generate_conditions_batch Function
+# ============================================================================
+
+
+class TestGenerateConditionsBatch:
+    """Test columnar batch generation."""
+
+    def test_batch_has_column_per_axis(self):
+        """Test that every axis gets a column of the requested length."""
+        batch = generate_conditions_batch(25, seed=42)
+
+        assert set(batch.keys()) == set(CONDITION_AXES.keys())
+        for column in batch.values():
+            assert len(column) == 25
+
+    def test_batch_values_valid(self):
+        """Test that every present value is valid for its axis."""
+        batch = generate_conditions_batch(100, seed=7)
+
+        for axis, column in batch.items():
+            for value in column:
+                assert value is None or value in CONDITION_AXES[axis]
+
+    def test_batch_reproducible_with_seed(self):
+        """Test that same seed produces the same batch."""
+        assert generate_conditions_batch(50, seed=42) == generate_conditions_batch(50, seed=42)
+
+    def test_batch_matches_sequential_draws(self):
+        """Test the batch loop consumes the RNG exactly like generate_condition's rules."""
+        rng = random.Random(7)
+        expected = [generate_condition_with_rng(rng) for _ in range(300)]
+        batch = generate_conditions_batch(300, seed=7)
+
+        for row, condition in enumerate(expected):
+            present = {axis: column[row] for axis, column in batch.items() if column[row]}
+            assert present == condition
+
+    def test_smaller_batch_is_prefix_of_larger(self):
+        """Test that a batch is a prefix of a larger batch with the same seed."""
+        small = generate_conditions_batch(40, seed=3)
+        large = generate_conditions_batch(100, seed=3)
+
+        assert small == {axis: column[:40] for axis, column in large.items()}
+
+    def test_batch_respects_exclusions(self):
+        """Test that no row violates an exclusion rule."""
+        batch = generate_conditions_batch(500, seed=0)
+
+        for row in range(500):
+            for (axis, value), blocked in EXCLUSIONS.items():
+                if batch[axis][row] != value:
+                    continue
+                for blocked_axis, blocked_values in blocked.items():
+                    assert batch[blocked_axis][row] not in blocked_values
+
+    def test_batch_zero_count(self):
+        """Test that an empty batch still has every axis column."""
+        batch = generate_conditions_batch(0, seed=1)
+
+        assert all(column == [] for column in batch.values())
+
+
+# ============================================================================
+# Test generate_conditions_range Function
+# ============================================================================
+
+
+class TestGenerateConditionsRange:
+    """Test the integer-coded, per-seed generate_conditions_range function."""
+
+    def test_range_rows_match_generate_condition(self):
+        """Test that row i decodes to generate_condition(seed=start + i)."""
+        columns = generate_conditions_range(100, 300)
+
+        for row, seed in enumerate(range(100, 300)):
+            decoded = {
+                axis: AXIS_VALUES[axis][column[row]]
+                for axis, column in columns.items()
+                if column[row] != -1
+            }
+            assert decoded == generate_condition(seed=seed)
+
+    def test_range_decode_matches_codes(self):
+        """Test that decode=True returns the decoded code columns."""
+        codes = generate_conditions_range(0, 150)
+        decoded = generate_conditions_range(0, 150, decode=True)
+
+        for axis, column in codes.items():
+            assert decoded[axis] == [AXIS_VALUES[axis][c] if c != -1 else None for c in column]
+
+    def test_range_codes_in_bounds(self):
+        """Test that every code is -1 or a valid index into AXIS_VALUES."""
+        columns = generate_conditions_range(0, 200)
+
+        assert columns.keys() == CONDITION_AXES.keys()
+        for axis, column in columns.items():
+            assert len(column) == 200
+            assert all(-1 <= code < len(AXIS_VALUES[axis]) for code in column)
+
+    def test_axis_value_index_inverts_axis_values(self):
+        """Test that AXIS_VALUE_INDEX encodes what AXIS_VALUES decodes."""
+        for axis, values in AXIS_VALUES.items():
+            assert values == tuple(CONDITION_AXES[axis])
+            assert [AXIS_VALUE_INDEX[axis][value] for value in values] == list(range(len(values)))
+
+    def test_empty_range(self):
+        """Test that an empty or reversed range yields empty columns."""
+        for start, stop in [(5, 5), (10, 3)]:
+            columns = generate_conditions_range(start, stop)
+            assert all(len(column) == 0 for column in columns.values())
+
+
 # ============================================================================
 # Test condition_to_prompt Function
 # ============================================================================
@@ -505,28 +782,17 @@ class TestIntegration:
         # Should have good diversity (at least 20 unique prompts out of 50)
         assert len(prompts) >= 20, f"Low diversity: only {len(prompts)} unique prompts"
 
-    def test_facial_signal_can_be_selected(self):
+    def test_facial_signal_can_be_selected(self, seeded_columns):
         """Test that facial_signal can appear in generated conditions."""
-        facial_signal_found = False
+        signal = next(filter(None, seeded_columns["facial_signal"][:100]), None)
 
-        for seed in range(100):
-            condition = generate_condition(seed=seed)
-            if "facial_signal" in condition:
-                facial_signal_found = True
-                # Verify it's a valid value
-                assert condition["facial_signal"] in CONDITION_AXES["facial_signal"]
-                break
+        assert signal is not None, "facial_signal never appeared in 100 generations"
+        # Verify it's a valid value
+        assert signal in CONDITION_AXES["facial_signal"]
 
-        assert facial_signal_found, "facial_signal never appeared in 100 generations"
-
-    def test_all_facial_signals_can_appear(self):
+    def test_all_facial_signals_can_appear(self, seeded_columns):
         """Test that all facial signal values can appear over many generations."""
-        facial_signals_found = set()
-
-        for seed in range(2000):
-            condition = generate_condition(seed=seed)
-            if "facial_signal" in condition:
-                facial_signals_found.add(condition["facial_signal"])
+        facial_signals_found = set(seeded_columns["facial_signal"]) - {None}
 
         expected_signals = set(CONDITION_AXES["facial_signal"])
         missing_signals = expected_signals - facial_signals_found
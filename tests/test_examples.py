@@ -13,6 +13,16 @@ from pathlib import Path
 
 import pytest
 
+from condition_axis import (
+    AXIS_VALUES,
+    CONDITION_AXES,
+    OCCUPATION_AXES,
+    condition_to_prompt,
+    generate_condition,
+    generate_occupation_condition,
+    occupation_condition_to_prompt,
+)
+
 # Add examples directory to Python path for imports
 examples_dir = Path(__file__).parent.parent / "examples"
 sys.path.insert(0, str(examples_dir))
@@ -109,11 +119,6 @@ def test_format_as_narrative(test_seed: int) -> None:
     """
     from integration_example import format_as_narrative
 
-    from condition_axis import (
-        generate_condition,
-        generate_occupation_condition,
-    )
-
     character = generate_condition(seed=test_seed)
     facial = (
         {"facial_signal": character.get("facial_signal", "")}
@@ -130,6 +135,59 @@ def test_format_as_narrative(test_seed: int) -> None:
     assert narrative.endswith(".")
 
 
+def test_format_as_narrative_templates() -> None:
+    """Test that the precomputed templates give each field combination's sentence."""
+    from integration_example import format_as_narrative
+
+    character = {
+        "physique": "wiry",
+        "wealth": "poor",
+        "health": "weary",
+        "facial_signal": "weathered",
+    }
+    occupation = {"legitimacy": "tolerated", "visibility": "discreet"}
+
+    assert format_as_narrative(character, {}, occupation) == (
+        "A wiry, poor individual. with a weathered face. bearing signs of being weary. "
+        "whose tolerated work and discreet presence suggests careful positioning."
+    )
+
+    # Absent fields drop their part; the remaining parts keep their text
+    del character["health"]
+    assert format_as_narrative(character, {}, occupation) == (
+        "A wiry, poor individual. with a weathered face. "
+        "whose tolerated work and discreet presence suggests careful positioning."
+    )
+    assert format_as_narrative({"physique": "broad"}, {"facial_signal": "scarred"}, {}) == (
+        "A broad individual. with a scarred face."
+    )
+    assert format_as_narrative({}, {}, {"visibility": "hidden"}) == (
+        "whose hidden presence suggests careful positioning."
+    )
+    assert format_as_narrative({}, {}, {}) == "."
+
+
+def test_render_matches_direct_generation(test_seed: int) -> None:
+    """Test that a RenderedEntity matches generating the seed directly.
+
+    Args:
+        test_seed: Pytest fixture providing test seed.
+    """
+    from integration_example import _render
+
+    entity = _render(test_seed)
+    character = generate_condition(seed=test_seed)
+    occupation = generate_occupation_condition(seed=test_seed)
+
+    assert entity.character == character
+    assert entity.occupation == occupation
+    assert entity.char_prompt == condition_to_prompt(character)
+    assert entity.occ_prompt == occupation_condition_to_prompt(occupation)
+    assert entity.full_prompt == ", ".join(
+        filter(None, (entity.char_prompt, entity.face_prompt, entity.occ_prompt))
+    )
+
+
 def test_integration_examples_run_without_errors() -> None:
     """Test that all integration_example examples execute without errors."""
     from integration_example import (
@@ -164,17 +222,22 @@ def test_generate_entity_function(test_seed: int) -> None:
     Args:
         test_seed: Pytest fixture providing test seed.
     """
-    from batch_generation import generate_entity
+    from batch_generation import Entity, generate_entity
 
     entity = generate_entity(test_seed)
 
     # Verify structure
-    assert isinstance(entity, dict)
-    assert "seed" in entity
-    assert "character" in entity
-    assert "facial" in entity
-    assert "occupation" in entity
-    assert entity["seed"] == test_seed
+    assert isinstance(entity, Entity)
+    assert entity.seed == test_seed
+    assert isinstance(entity.character, dict)
+    assert isinstance(entity.facial, dict)
+    assert isinstance(entity.occupation, dict)
+    assert entity.to_dict() == {
+        "seed": test_seed,
+        "character": entity.character,
+        "facial": entity.facial,
+        "occupation": entity.occupation,
+    }
 
 
 def test_generate_batch_function(test_seed: int) -> None:
@@ -193,10 +256,174 @@ def test_generate_batch_function(test_seed: int) -> None:
     assert len(batch) == count
 
     # Verify first entity has correct seed
-    assert batch[0]["seed"] == test_seed
+    assert batch[0].seed == test_seed
 
     # Verify last entity has correct seed
-    assert batch[-1]["seed"] == test_seed + count - 1
+    assert batch[-1].seed == test_seed + count - 1
+
+
+def test_generate_batch_columnar_matches_batch(test_seed: int) -> None:
+    """Test that generate_batch_columnar holds the same entities as generate_batch.
+
+    Args:
+        test_seed: Pytest fixture providing test seed.
+    """
+    from batch_generation import generate_batch, generate_batch_columnar
+
+    count = 25
+    columns = generate_batch_columnar(start_seed=test_seed, count=count)
+    batch = generate_batch(start_seed=test_seed, count=count)
+
+    assert all(len(column) == count for column in columns.values())
+    for row, entity in enumerate(batch):
+        assert columns["seed"][row] == entity.seed
+        for source in (entity.character, entity.occupation):
+            for axis, value in source.items():
+                assert columns[axis][row] == value
+        present = sum(columns[axis][row] is not None for axis in columns if axis != "seed")
+        assert present == len(entity.character) + len(entity.occupation)
+
+
+def test_batch_values_share_vocabulary_strings(test_seed: int) -> None:
+    """Test that generated values are the axis vocabulary objects, not copies.
+
+    Entities reference the strings in CONDITION_AXES / OCCUPATION_AXES, so a
+    large batch holds one object per distinct value rather than per row.
+
+    Args:
+        test_seed: Pytest fixture providing test seed.
+    """
+    from batch_generation import generate_batch, generate_batch_columnar
+
+    vocabulary = {id(value) for values in CONDITION_AXES.values() for value in values}
+    vocabulary |= {id(value) for values in OCCUPATION_AXES.values() for value in values}
+
+    for entity in generate_batch(start_seed=test_seed, count=50):
+        for condition in (entity.character, entity.occupation):
+            assert all(id(value) in vocabulary for value in condition.values())
+
+    columns = generate_batch_columnar(start_seed=test_seed, count=50)
+    for axis, column in columns.items():
+        if axis != "seed":
+            assert all(id(value) in vocabulary for value in column if value is not None)
+
+
+def test_generate_batch_codes_decode_to_columnar(test_seed: int) -> None:
+    """Test that integer code columns decode to the columnar batch.
+
+    Args:
+        test_seed: Pytest fixture providing test seed.
+    """
+    from batch_generation import generate_batch_codes, generate_batch_columnar
+
+    codes = generate_batch_codes(start_seed=test_seed, count=12)
+    columns = generate_batch_columnar(start_seed=test_seed, count=12)
+
+    assert list(codes) == list(columns)
+    assert codes["seed"].tolist() == columns["seed"]
+    for axis, values in (*AXIS_VALUES.items(), *OCCUPATION_AXES.items()):
+        decoded = [values[code] if code >= 0 else None for code in codes[axis]]
+        assert decoded == columns[axis]
+
+
+def test_write_entities_json_matches_batch(test_seed: int) -> None:
+    """Test that the streamed JSON export parses to the full batch document.
+
+    Args:
+        test_seed: Pytest fixture providing test seed.
+    """
+    import io
+    import json
+
+    from batch_generation import generate_batch, write_entities_json
+
+    metadata = {"start_seed": test_seed, "count": 7}
+    buffer = io.StringIO()
+    write_entities_json(buffer, test_seed, 7, metadata)
+
+    assert json.loads(buffer.getvalue()) == {
+        "metadata": metadata,
+        "entities": [entity.to_dict() for entity in generate_batch(start_seed=test_seed, count=7)],
+    }
+
+    empty = io.StringIO()
+    write_entities_json(empty, test_seed, 0, metadata)
+    assert json.loads(empty.getvalue())["entities"] == []
+
+
+def test_write_entities_csv_rows(test_seed: int) -> None:
+    """Test that the streamed CSV export has a header and one row per entity.
+
+    Args:
+        test_seed: Pytest fixture providing test seed.
+    """
+    import csv
+    import io
+
+    from batch_generation import CSV_FIELDNAMES, generate_batch, write_entities_csv
+
+    buffer = io.StringIO(newline="")
+    write_entities_csv(buffer, test_seed, 6)
+    buffer.seek(0)
+    header, *rows = csv.reader(buffer)
+
+    assert tuple(header) == CSV_FIELDNAMES
+    assert len(rows) == 6
+    for row, entity in zip(rows, generate_batch(start_seed=test_seed, count=6), strict=True):
+        record = dict(zip(header, row, strict=True))
+        assert record["seed"] == str(entity.seed)
+        assert record["wealth"] == entity.character.get("wealth", "")
+        assert record["legitimacy"] == entity.occupation.get("legitimacy", "")
+        assert ", ," not in record["full_prompt"]
+        assert not record["full_prompt"].startswith(", ")
+        assert not record["full_prompt"].endswith(", ")
+
+
+def test_write_entities_codes_round_trip(test_seed: int) -> None:
+    """Test that binary code columns read back as generate_batch_codes().
+
+    Args:
+        test_seed: Pytest fixture providing test seed.
+    """
+    import io
+
+    from batch_generation import generate_batch_codes, read_entities_codes, write_entities_codes
+
+    buffer = io.BytesIO()
+    write_entities_codes(buffer, test_seed, 9)
+    buffer.seek(0)
+
+    assert read_entities_codes(buffer) == generate_batch_codes(start_seed=test_seed, count=9)
+    assert buffer.read() == b""
+
+
+def test_generate_batch_parallel_matches_batch(test_seed: int) -> None:
+    """Test that parallel generation yields the same entities as generate_batch.
+
+    Args:
+        test_seed: Pytest fixture providing test seed.
+    """
+    from batch_generation import generate_batch, generate_batch_parallel
+
+    expected = generate_batch(start_seed=test_seed, count=45)
+
+    # Multiple ranges (pool path) and a single range (in-process path)
+    for chunk in (10, 100):
+        entities = generate_batch_parallel(test_seed, 45, workers=2, chunk=chunk)
+        assert sorted(entities, key=lambda e: e.seed) == expected
+
+
+@pytest.mark.parametrize("kwargs", [{"chunk": 0}, {"chunk": -5}, {"workers": 0}, {"workers": -1}])
+def test_generate_batch_parallel_rejects_invalid_sizes(kwargs: dict[str, int]) -> None:
+    """Test that invalid chunk/workers raise ValueError on the call itself.
+
+    Args:
+        kwargs: Invalid chunk or workers argument.
+    """
+    from batch_generation import generate_batch_parallel
+
+    with pytest.raises(ValueError):
+        generate_batch_parallel(0, 10, **kwargs)
 
 
 def test_generate_streaming_function(test_seed: int) -> None:
@@ -215,7 +442,30 @@ def test_generate_streaming_function(test_seed: int) -> None:
 
     # Verify seeds are sequential
     for i, entity in enumerate(entities):
-        assert entity["seed"] == test_seed + i
+        assert entity.seed == test_seed + i
+
+
+def test_generate_streaming_values_matches_entities(test_seed: int) -> None:
+    """Test that the slim value stream matches the full entities.
+
+    Args:
+        test_seed: Pytest fixture providing test seed.
+    """
+    from batch_generation import generate_streaming, generate_streaming_values
+
+    axes = ("wealth", "legitimacy", "age", "risk_exposure")
+    rows = list(generate_streaming_values(start_seed=test_seed, count=20, axes=axes))
+
+    assert len(rows) == 20
+    for row, entity in zip(rows, generate_streaming(test_seed, 20), strict=True):
+        merged = {**entity.character, **entity.occupation}
+        assert row == tuple(merged.get(axis) for axis in axes)
+
+    # A single condition system is all that gets generated
+    only_character = generate_streaming_values(test_seed, 3, axes=("wealth",))
+    assert [row[0] for row in only_character] == [
+        entity.character.get("wealth") for entity in generate_streaming(test_seed, 3)
+    ]
 
 
 def test_batch_generation_examples_run_without_errors() -> None:
@@ -300,6 +550,27 @@ def test_tech_system_generation(test_seed: int) -> None:
     assert len(prompt) > 0
 
 
+def test_custom_generators_leave_global_random_untouched(test_seed: int) -> None:
+    """Test that custom generators use a local RNG, not the global one.
+
+    Args:
+        test_seed: Pytest fixture providing test seed.
+    """
+    import random
+
+    from custom_axes import generate_magic_condition, generate_tech_condition
+
+    state = random.getstate()
+    generate_magic_condition(seed=test_seed)
+    generate_tech_condition(seed=test_seed)
+    assert random.getstate() == state
+
+    # An explicit rng gives the same result as the equivalent seed
+    assert generate_magic_condition(rng=random.Random(test_seed)) == generate_magic_condition(
+        seed=test_seed
+    )
+
+
 def test_custom_axes_examples_run_without_errors() -> None:
     """Test that all custom_axes examples execute without errors."""
     from custom_axes import (
@@ -336,11 +607,6 @@ def test_build_full_prompt_function(test_seed: int) -> None:
     """
     from image_prompt_generation import build_full_prompt
 
-    from condition_axis import (
-        generate_condition,
-        generate_occupation_condition,
-    )
-
     character = generate_condition(seed=test_seed)
     facial = (
         {"facial_signal": character.get("facial_signal", "")}
@@ -378,6 +644,32 @@ def test_build_full_prompt_function(test_seed: int) -> None:
     assert "standing in a medieval tavern" in detailed_prompt
 
 
+def test_build_prompt_from_bundle_matches_full_prompt(test_seed: int) -> None:
+    """Test that bundled prompts equal build_full_prompt on the same conditions.
+
+    Args:
+        test_seed: Pytest fixture providing test seed.
+    """
+    from image_prompt_generation import _bundle, build_full_prompt, build_prompt_from_bundle
+
+    bundle = _bundle(test_seed)
+
+    for kwargs in (
+        {},
+        {"style": "oil painting"},
+        {"quality_tags": ["detailed", "8k resolution"]},
+        {"style": "portrait", "additional_details": "in a tavern", "quality_tags": ["sharp"]},
+        {"style": "portrait", "quality_tags": "detailed, 8k resolution"},
+    ):
+        expected = build_full_prompt(bundle.character, bundle.facial, bundle.occupation, **kwargs)
+        assert build_prompt_from_bundle(bundle, **kwargs) == expected
+
+    # A pre-joined tag string is one part, identical to the list form
+    assert build_prompt_from_bundle(bundle, quality_tags="a, b") == build_prompt_from_bundle(
+        bundle, quality_tags=["a", "b"]
+    )
+
+
 def test_build_negative_prompt_function() -> None:
     """Test the build_negative_prompt function."""
     from image_prompt_generation import build_negative_prompt
@@ -416,6 +708,22 @@ def test_image_prompt_generation_examples_run_without_errors() -> None:
     example_7_prompt_engineering_tips()
 
 
+def test_image_prompt_main_no_tips(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that --no-tips skips only the best-practices text.
+
+    Args:
+        capsys: Pytest fixture capturing stdout.
+    """
+    from image_prompt_generation import main
+
+    main(["--no-tips"])
+    output = capsys.readouterr().out
+
+    assert "EXAMPLE 6" in output
+    assert "BEST PRACTICES" not in output
+    assert "All image prompt generation examples completed successfully!" in output
+
+
 # ============================================================================
 # Reproducibility Tests
 # ============================================================================
@@ -451,6 +759,38 @@ def test_custom_tech_reproducibility(seed: int) -> None:
     assert tech1 == tech2, f"Tech generation not reproducible with seed {seed}"
 
 
+@pytest.mark.parametrize("max_optional", [0, 1, 2, 3, 6])
+def test_custom_optional_subsets_match_randint_then_sample(max_optional: int) -> None:
+    """Test each ordered selection has its randint + sample probability.
+
+    Args:
+        max_optional: Maximum number of optional axes per entity.
+    """
+    from collections import Counter
+    from fractions import Fraction
+    from math import perm
+
+    from custom_axes import _build_optional_subsets
+
+    optional = ["a", "b", "c", "d", "e", "f"]
+    table = _build_optional_subsets(optional, max_optional)
+    counts = Counter(table)
+    k_max = min(max_optional, len(optional))
+
+    for selection, count in counts.items():
+        expected = Fraction(1, (k_max + 1) * perm(len(optional), len(selection)))
+        assert Fraction(count, len(table)) == expected
+    assert sum(perm(len(optional), k) for k in range(k_max + 1)) == len(counts)
+
+
+def test_custom_optional_subsets_have_no_repeats() -> None:
+    """Test that no selection repeats an axis or exceeds the maximum."""
+    from custom_axes import _build_optional_subsets
+
+    for selection in _build_optional_subsets(["a", "b", "c"], 2):
+        assert len(set(selection)) == len(selection) <= 2
+
+
 @pytest.mark.parametrize("seed", [0, 42, 100, 999])
 def test_batch_generation_reproducibility(seed: int) -> None:
     """Test that batch generation is reproducible with seeds.
@@ -558,11 +898,6 @@ def test_build_full_prompt_with_empty_components(test_seed: int) -> None:
     """
     from image_prompt_generation import build_full_prompt
 
-    from condition_axis import (
-        generate_condition,
-        generate_occupation_condition,
-    )
-
     character = generate_condition(seed=test_seed)
     facial = (
         {"facial_signal": character.get("facial_signal", "")}
@@ -12,6 +12,9 @@ Test coverage includes:
 - Helper functions
 """
 
+import logging
+import random
+
 import pytest
 
 from condition_axis import (
@@ -20,6 +23,7 @@ from condition_axis import (
     OCCUPATION_POLICY,
     OCCUPATION_WEIGHTS,
     generate_occupation_condition,
+    generate_occupation_condition_with_rng,
     get_available_occupation_axes,
     get_occupation_axis_values,
     occupation_condition_to_prompt,
@@ -272,6 +276,26 @@ class TestGenerateOccupationCondition:
         assert isinstance(result, dict)
         assert len(result) > 0
 
+    def test_generate_occupation_condition_with_reseeded_rng_matches_seed(self):
+        """Test that reseeding one Random reproduces generate_occupation_condition(seed=k)."""
+        rng = random.Random()
+
+        for seed in range(50):
+            rng.seed(seed)
+            assert generate_occupation_condition_with_rng(rng) == generate_occupation_condition(
+                seed=seed
+            )
+
+    def test_generate_occupation_condition_same_with_debug_logging(self, caplog):
+        """Test that enabling DEBUG logging does not change generated occupations."""
+        quiet = [generate_occupation_condition(seed=seed) for seed in range(100)]
+
+        with caplog.at_level(logging.DEBUG, logger="condition_axis.occupation_axis"):
+            logged = [generate_occupation_condition(seed=seed) for seed in range(100)]
+
+        assert logged == quiet
+        assert any("Mandatory axis selected" in message for message in caplog.messages)
+
     def test_generate_occupation_condition_weighted_distribution(self):
         """Test that weights affect probability distribution (statistical test)."""
         # Focus on legitimacy axis which has strong weights
@@ -528,6 +552,21 @@ class TestEdgeCases:
         assert isinstance(result, dict)
         assert len(result) > 0
 
+    def test_extended_axis_values_are_generated(self, monkeypatch):
+        """Test that values appended to OCCUPATION_AXES after import are drawn."""
+        monkeypatch.setitem(
+            OCCUPATION_WEIGHTS, "visibility", {**OCCUPATION_WEIGHTS["visibility"], "famous": 1000.0}
+        )
+        OCCUPATION_AXES["visibility"].append("famous")
+        try:
+            generated = {
+                generate_occupation_condition(seed=seed).get("visibility") for seed in range(50)
+            }
+        finally:
+            OCCUPATION_AXES["visibility"].pop()
+
+        assert "famous" in generated
+
     def test_occupation_condition_to_prompt_preserves_order(self):
         """Test that occupation_condition_to_prompt preserves dict insertion order (Python 3.7+)."""
         # Create condition with known order